@@ -1,9 +1,23 @@
 # Package initialization
+import importlib
+
 from .constants import *
-from .player import Player
-from .bouncer import Bouncer
-from .collectible import Collectible
-from .game import Game
-from .level import Level
-from .sound_manager import SoundManager
-from .ui import UI
\ No newline at end of file
+
+# Everything else is imported on first access, so importing the package
+# doesn't pull in pygame, numpy and every game module up front
+_LAZY_EXPORTS = {
+    'Player': 'player',
+    'Bouncer': 'bouncer',
+    'Collectible': 'collectible',
+    'Game': 'game',
+    'Level': 'level',
+    'SoundManager': 'sound_manager',
+    'UI': 'ui',
+}
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
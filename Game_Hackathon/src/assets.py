@@ -0,0 +1,77 @@
+# File: src/assets.py
+import os
+import threading
+from collections import OrderedDict
+
+import pygame
+from constants import IMAGES_PATH, ASSET_CACHE_BUDGET
+
+class AssetCache:
+    """Process-wide cache of decoded, converted and scaled image surfaces.
+
+    Entries are keyed by (filename, size, alpha). Surfaces are shared between
+    every sprite that asks for the same key, so callers must never draw onto
+    a surface they got from the cache. Safe to use from the level prefetch
+    thread.
+    """
+    def __init__(self, budget=ASSET_CACHE_BUDGET):
+        self.budget    = budget
+        self.surfaces  = OrderedDict()   # key -> Surface, least recently used first
+        self.memory    = 0
+        self.hits      = 0
+        self.misses    = 0
+        self.evictions = 0
+        self.lock      = threading.RLock()
+
+    def image(self, filename, size=None, alpha=True):
+        """Return the shared surface for filename, scaled to size if given."""
+        key = (filename, tuple(size) if size else None, alpha)
+        with self.lock:
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                self.surfaces.move_to_end(key)
+                self.hits += 1
+                return surface
+
+            self.misses += 1
+            surface = pygame.image.load(os.path.join(IMAGES_PATH, filename))
+            surface = surface.convert_alpha() if alpha else surface.convert()
+            if key[1]:
+                surface = pygame.transform.scale(surface, key[1])
+            self._store(key, surface)
+            return surface
+
+    def preload(self, keys):
+        """Decode every (filename, size, alpha) key up front."""
+        for filename, size, alpha in keys:
+            self.image(filename, size, alpha)
+
+    def _store(self, key, surface):
+        self.surfaces[key] = surface
+        self.memory += surface_bytes(surface)
+        # Evict least recently used entries, but never the one just added.
+        # Sprites still holding an evicted surface keep it alive on their own.
+        while self.memory > self.budget and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.memory -= surface_bytes(old)
+            self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.surfaces.clear()
+            self.memory = 0
+
+    def stats(self):
+        return {
+            "entries":   len(self.surfaces),
+            "memory":    self.memory,
+            "budget":    self.budget,
+            "hits":      self.hits,
+            "misses":    self.misses,
+            "evictions": self.evictions,
+        }
+
+def surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+asset_cache = AssetCache()
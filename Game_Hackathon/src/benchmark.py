@@ -0,0 +1,244 @@
+# File: src/benchmark.py
+"""Frame-time benchmarks for Game and the main_menu.py render loop.
+
+Runs fixed-length sessions under SDL's dummy drivers on synthetic levels and
+reports per-phase p50/p95/p99 frame times. Results are also written as JSON
+so runs from different commits can be compared.
+
+    python benchmark.py
+    python benchmark.py --enemies 5 50 200 --width 2 20 --frames 600
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from constants import SCREEN_WIDTH, OUTFIT_ORDER
+from game import Game
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+def make_level(enemies=3, collectibles=2, hiding_spots=3, width=SCREEN_WIDTH*2):
+    """Synthetic LEVELS entry with the given entity counts and width in px."""
+    return {
+        'name': f'Benchmark {enemies}e {collectibles}c {hiding_spots}h {width}px',
+        'bg_color': (0,0,0),
+        'music': 'level1_theme.mp3',
+        'enemies': enemies,
+        'collectibles': [OUTFIT_ORDER[i % len(OUTFIT_ORDER)] for i in range(collectibles)],
+        'hiding_spot_count': hiding_spots,
+        'width': width,
+    }
+
+class PhaseTimer:
+    """Accumulates time spent in wrapped callables, per phase and per frame."""
+    def __init__(self):
+        self.current = defaultdict(float)
+        self.samples = defaultdict(list)
+
+    def wrap(self, phase, fn):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.current[phase] += time.perf_counter() - start
+        return timed
+
+    def add(self, phase, seconds):
+        self.current[phase] += seconds
+
+    def end_frame(self, phases):
+        for phase in phases:
+            self.samples[phase].append(self.current.pop(phase, 0.0))
+
+    def report(self):
+        return {phase: summarize(values) for phase, values in self.samples.items()}
+
+def percentile(ordered, q):
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def summarize(seconds):
+    ordered = sorted(s * 1000 for s in seconds)
+    return {
+        "p50":  percentile(ordered, 50),
+        "p95":  percentile(ordered, 95),
+        "p99":  percentile(ordered, 99),
+        "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+        "max":  ordered[-1] if ordered else 0.0,
+    }
+
+class SweepInput:
+    """Sweeps the player back and forth across the level, jumping now and then."""
+    def __init__(self):
+        self.heading = pygame.K_RIGHT
+
+    def keys(self, game, frame):
+        if game.player.rect.right >= game.level.width - 5:
+            self.heading = pygame.K_LEFT
+        elif game.player.rect.left <= 5:
+            self.heading = pygame.K_RIGHT
+        keys = {self.heading}
+        if frame % 90 == 0:
+            keys.add(pygame.K_SPACE)
+        return keys
+
+GAME_PHASES = ("events", "player", "enemies", "draw", "frame")
+
+def run_game_session(level_data, frames, warmup, seed, pixel_collision=False):
+    game = Game(headless=True, levels=[level_data], seed=seed, pixel_collision=pixel_collision)
+    timer = PhaseTimer()
+    # Instance attributes shadow the methods, so Game.update's own calls are timed
+    game.handle_events  = timer.wrap("events",  game.handle_events)
+    game.handle_key     = timer.wrap("events",  game.handle_key)
+    game.update_player  = timer.wrap("player",  game.update_player)
+    game.update_enemies = timer.wrap("enemies", game.update_enemies)
+    game.draw           = timer.wrap("draw",    game.draw)
+
+    script = SweepInput()
+    catches = 0
+    drawn = culled = 0
+    warmup_checks = 0   # mask checks made during warmup, left out of the report
+    for frame in range(warmup + frames):
+        start = time.perf_counter()
+        game.handle_events()
+        game.step(script.keys(game, frame))
+        game.draw()
+        timer.add("frame", time.perf_counter() - start)
+        if game.game_state == "game_over":
+            # Keep the session on the same level; vision checks keep running
+            catches += 1
+            game.game_state = "playing"
+        if frame < warmup:
+            timer.current.clear()
+            if game.collider:
+                warmup_checks = game.collider.total_checks
+        else:
+            timer.end_frame(GAME_PHASES)
+            drawn += game.draw_stats["drawn"]
+            culled += game.draw_stats["culled"]
+
+    result = {
+        "level": {
+            "enemies": level_data["enemies"],
+            "collectibles": len(level_data["collectibles"]),
+            "hiding_spots": level_data["hiding_spot_count"],
+            "width": level_data["width"],
+        },
+        "frames": frames,
+        "catches": catches,
+        "draws_per_frame": drawn / frames,
+        "culled_per_frame": culled / frames,
+        "phases": timer.report(),
+    }
+    if game.collider:
+        result["mask_checks_per_frame"] = (game.collider.total_checks - warmup_checks) / frames
+    return result
+
+MENU_PHASES = ("events", "draw", "flip", "frame")
+
+def run_menu_session(frames, warmup, instructions):
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    import main_menu
+
+    main_menu.init()
+    main_menu.show_instructions = False
+    if instructions:
+        main_menu.open_instructions()
+    timer = PhaseTimer()
+    for frame in range(warmup + frames):
+        start = time.perf_counter()
+        timer.wrap("events", main_menu.handle_events)()
+        timer.wrap("draw", main_menu.draw_frame)()
+        timer.wrap("flip", pygame.display.flip)()
+        timer.add("frame", time.perf_counter() - start)
+        if frame < warmup:
+            timer.current.clear()
+        else:
+            timer.end_frame(MENU_PHASES)
+    main_menu.show_instructions = False
+
+    return {
+        "screen": "instructions" if instructions else "menu",
+        "frames": frames,
+        "phases": timer.report(),
+    }
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_session(title, result):
+    print(title)
+    if "culled_per_frame" in result:
+        print(f"  draws/frame {result['draws_per_frame']:.1f}, culled/frame {result['culled_per_frame']:.1f}")
+    if "mask_checks_per_frame" in result:
+        print(f"  mask checks/frame {result['mask_checks_per_frame']:.1f}")
+    for phase, stats in result["phases"].items():
+        print(f"  {phase:<8} p50 {stats['p50']:7.3f} ms  p95 {stats['p95']:7.3f} ms  "
+              f"p99 {stats['p99']:7.3f} ms")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--enemies", type=int, nargs="+", default=[3, 20, 100])
+    parser.add_argument("--collectibles", type=int, nargs="+", default=[3])
+    parser.add_argument("--hiding-spots", type=int, nargs="+", default=[3])
+    parser.add_argument("--width", type=int, nargs="+", default=[2, 10],
+                        help="level widths, in screens")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-menu", action="store_true", help="skip the main_menu.py sessions")
+    parser.add_argument("--pixel-collision", action="store_true", help="use mask-based collision")
+    parser.add_argument("--output", default="bench_results.json")
+    args = parser.parse_args(argv)
+
+    results = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "frames": args.frames,
+        "seed": args.seed,
+        "game": [],
+        "menu": [],
+    }
+
+    for width in args.width:
+        for enemies in args.enemies:
+            for collectibles in args.collectibles:
+                for hiding_spots in args.hiding_spots:
+                    level_data = make_level(enemies, collectibles, hiding_spots, width * SCREEN_WIDTH)
+                    result = run_game_session(level_data, args.frames, args.warmup, args.seed,
+                                              args.pixel_collision)
+                    results["game"].append(result)
+                    print_session(level_data["name"], result)
+
+    if not args.no_menu:
+        for instructions in (False, True):
+            result = run_menu_session(args.frames, args.warmup, instructions)
+            results["menu"].append(result)
+            print_session(f"main_menu.py ({result['screen']})", result)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {args.output}")
+
+if __name__ == "__main__":
+    main()
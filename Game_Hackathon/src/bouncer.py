@@ -1,98 +1,207 @@
 import pygame
-import os
 import math
 import random
+import numpy as np
 from constants import *
+from assets import asset_cache
+from collision import image_mask
 
-class Bouncer(pygame.sprite.Sprite):
-    def __init__(self, x, y, patrol_points):
-        super().__init__()
-        self.patrol_points = patrol_points
-        self.current_point = 0
-        self.speed = BOUNCER_SPEED
-        self.direction = 1
-        self.alerted = False
-        self.alert_timer = 0
-        self.load_images()
-        self.image = self.idle_image
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
-        self.mask = pygame.mask.from_surface(self.image)
-
-    def load_images(self):
-        self.idle_image = pygame.image.load(os.path.join(IMAGES_PATH, "Bouncer-ideal.png")).convert_alpha()
-        self.idle_image = pygame.transform.scale(self.idle_image, (TILE_SIZE, TILE_SIZE)) # Scale it
-        self.alert_image = pygame.image.load(os.path.join(IMAGES_PATH, "Bouncer-Caught-character.png")).convert_alpha()
-        self.alert_image = pygame.transform.scale(self.alert_image, (TILE_SIZE, TILE_SIZE)) # Scale it
+class Bouncer:
+    """Lightweight view of one bouncer stored in a BouncerManager.
 
-    def update(self):
-        # Patrol logic
-        target = self.patrol_points[self.current_point]
-        if abs(self.rect.x - target[0]) < self.speed:
-            self.current_point = (self.current_point + 1) % len(self.patrol_points)
-            self.direction = 1 if self.patrol_points[self.current_point][0] > self.rect.x else -1
-        
-        self.rect.x += self.speed * self.direction
-        
-        # Alert state
+    Reads position, facing and alert state from the manager's arrays, so
+    drawing and other per-bouncer code can keep using rect and alerted.
+    """
+    __slots__ = ("manager", "index")
+
+    IDLE_IMAGE  = ("Bouncer-ideal.png", (TILE_SIZE, TILE_SIZE), True)
+    ALERT_IMAGE = ("Bouncer-Caught-character.png", (TILE_SIZE, TILE_SIZE), True)
+
+    def __init__(self, manager, index):
+        self.manager = manager
+        self.index = index
+
+    @property
+    def rect(self):
+        m, i = self.manager, self.index
+        return pygame.Rect(int(m.x[i]), int(m.y[i]), *m.size)
+
+    @property
+    def direction(self):
+        return int(self.manager.direction[self.index])
+
+    @property
+    def alerted(self):
+        return bool(self.manager.alerted[self.index])
+
+    @property
+    def image(self):
+        return self.manager.alert_image if self.alerted else self.manager.idle_image
+
+    @property
+    def mask(self):
+        # Follows image, so alerting swaps masks along with sprites
+        return image_mask(self.image)
+
+    def alert(self):
+        self.manager.alert([self.index])
+
+    def draw_rect(self):
+        """World-space area draw() can touch, including the alert bar."""
+        bounds = self.rect.copy()
         if self.alerted:
-            self.alert_timer -= 1
-            if self.alert_timer <= 0:
-                self.alerted = False
-                self.image = self.idle_image
-
-    def check_vision(self, player):
-        if player.disco_active:
-            return False
-            
-        dx = player.rect.centerx - self.rect.centerx
-        dy = player.rect.centery - self.rect.centery
-        distance = math.sqrt(dx*dx + dy*dy)
-        
-        angle = math.degrees(math.atan2(-dy, dx)) % 360
-        angle_diff = abs((self.direction * 180 - angle + 180) % 360 - 180)
-        
-        if distance < VISION_CONE_LENGTH and angle_diff < VISION_CONE_ANGLE/2:
-            if not player.crouching:
-                self.alerted = True
-                self.alert_timer = 60
-                self.image = self.alert_image
-                return True
-        return False
+            bounds.union_ip((self.rect.x, self.rect.y - 25, self.rect.width, 20))
+        return bounds
+
+    def vision_rect(self):
+        """World-space bounding box of the vision cone."""
+        cone, (apex_x, apex_y) = cone_sprite(self.direction)
+        return cone.get_rect(topleft=(self.rect.centerx - apex_x, self.rect.centery - apex_y))
 
     def draw_vision_cone(self, screen, camera):
-        angle_rad = math.radians(self.direction * 180)
-        end_x = self.rect.centerx + VISION_CONE_LENGTH * math.cos(angle_rad)
-        end_y = self.rect.centery - camera.offset.y
-        
-        points = [
-            (self.rect.centerx - camera.offset.x, self.rect.centery - camera.offset.y),
-            (end_x - camera.offset.x, end_y - camera.offset.y)
-        ]
-        
-        angle_left = math.radians(self.direction * 180 - VISION_CONE_ANGLE/2)
-        angle_right = math.radians(self.direction * 180 + VISION_CONE_ANGLE/2)
-        
-        left_x = self.rect.centerx + VISION_CONE_LENGTH * math.cos(angle_left) - camera.offset.x
-        left_y = self.rect.centery - VISION_CONE_LENGTH * math.sin(angle_left) - camera.offset.y
-        
-        right_x = self.rect.centerx + VISION_CONE_LENGTH * math.cos(angle_right) - camera.offset.x
-        right_y = self.rect.centery - VISION_CONE_LENGTH * math.sin(angle_right) - camera.offset.y
-        
-        cone_points = [
-            (self.rect.centerx - camera.offset.x, self.rect.centery - camera.offset.y),
-            (left_x, left_y),
-            (right_x, right_y)
-        ]
-        
-        vision_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.polygon(vision_surface, (*NEON_PINK, 50), cone_points)
-        screen.blit(vision_surface, (0, 0))
+        # One pre-rendered cone per facing direction, blitted over its bounding
+        # box only; the blit clips whatever falls outside the screen.
+        cone, (apex_x, apex_y) = cone_sprite(self.direction)
+        screen.blit(cone, (
+            self.rect.centerx - camera.offset.x - apex_x,
+            self.rect.centery - camera.offset.y - apex_y
+        ))
 
     def draw(self, screen, camera):
         screen.blit(self.image, (self.rect.x - camera.offset.x, self.rect.y - camera.offset.y))
         if self.alerted:
-            alert_surf = pygame.Surface((self.rect.width, 20), pygame.SRCALPHA)
-            pygame.draw.rect(alert_surf, (255, 0, 0, 150), (0, 0, self.rect.width, 20))
-            screen.blit(alert_surf, (self.rect.x - camera.offset.x, self.rect.y - camera.offset.y - 25))
+            screen.blit(alert_bar(self.rect.width), (self.rect.x - camera.offset.x, self.rect.y - camera.offset.y - 25))
+
+class BouncerManager:
+    """Every bouncer in a level, stored as parallel numpy arrays.
+
+    spawns is a sequence of (x, y, patrol_points). Patrol waypoints are
+    padded into one (bouncers, most waypoints) array, so a tick of patrol
+    movement and alert cooldown is a handful of array operations no matter
+    how many bouncers there are. Iterating yields a Bouncer view per index.
+    """
+    def __init__(self, spawns=()):
+        spawns = list(spawns)
+        count = len(spawns)
+        most = max((len(points) for _, _, points in spawns), default=1)
+        self.size = (TILE_SIZE, TILE_SIZE)
+        self.spawn_x = np.array([x for x, _, _ in spawns], dtype=np.int64)
+        self.spawn_y = np.array([y for _, y, _ in spawns], dtype=np.int64)
+        self.speed = np.full(count, BOUNCER_SPEED, dtype=np.int64)
+        self.waypoints = np.zeros((count, most), dtype=np.int64)   # patrol x coords
+        self.waypoint_count = np.array([len(points) for _, _, points in spawns], dtype=np.int64)
+        for i, (_, _, points) in enumerate(spawns):
+            self.waypoints[i, :len(points)] = [px for px, _ in points]
+        self.idle_image  = asset_cache.image(*Bouncer.IDLE_IMAGE)
+        self.alert_image = asset_cache.image(*Bouncer.ALERT_IMAGE)
+        self.views = [Bouncer(self, i) for i in range(count)]
+        self.reset()
+
+    def reset(self):
+        """Every bouncer back at its spawn point, facing right and calm."""
+        count = len(self.views)
+        self.x = self.spawn_x.copy()
+        self.y = self.spawn_y.copy()
+        self.direction = np.ones(count, dtype=np.int64)
+        self.current = np.zeros(count, dtype=np.int64)
+        self.alerted = np.zeros(count, dtype=bool)
+        self.alert_timer = np.zeros(count, dtype=np.int64)
+
+    def update(self):
+        """Advance every patrol by one tick and count down alerts."""
+        rows = np.arange(len(self.views))
+        # Turn towards the next waypoint once within a step of the current one
+        arrived = np.abs(self.x - self.waypoints[rows, self.current]) < self.speed
+        self.current = np.where(arrived, (self.current + 1) % self.waypoint_count, self.current)
+        heading = np.where(self.waypoints[rows, self.current] > self.x, 1, -1)
+        self.direction = np.where(arrived, heading, self.direction)
+        self.x += self.speed * self.direction
+
+        self.alert_timer[self.alerted] -= 1
+        self.alerted &= self.alert_timer > 0
+
+    def alert(self, indices):
+        self.alerted[indices] = True
+        self.alert_timer[indices] = ALERT_DURATION * TICK_RATE // 1000   # in ticks
+
+    def centers(self):
+        width, height = self.size
+        return self.x + width // 2, self.y + height // 2
+
+    def visible(self, view):
+        """Boolean arrays (cones, bodies) of what overlaps view (world space).
+
+        Same bounds as Bouncer.vision_rect() and Bouncer.draw_rect(), worked
+        out for every bouncer at once.
+        """
+        cx, cy = self.centers()
+        facing_left = self.direction == 1
+        (left_cone, (left_ax, left_ay)), (right_cone, (right_ax, right_ay)) = cone_sprite(1), cone_sprite(-1)
+        cone_left = cx - np.where(facing_left, left_ax, right_ax)
+        cone_top = cy - np.where(facing_left, left_ay, right_ay)
+        cones = overlaps(
+            cone_left, cone_top,
+            cone_left + np.where(facing_left, left_cone.get_width(), right_cone.get_width()),
+            cone_top + np.where(facing_left, left_cone.get_height(), right_cone.get_height()),
+            view
+        )
+        width, height = self.size
+        body_top = np.where(self.alerted, self.y - 25, self.y)   # alert bar sits above
+        bodies = overlaps(self.x, body_top, self.x + width, self.y + height, view)
+        return cones, bodies
+
+    def positions(self):
+        return self.x.copy(), self.y.copy()
+
+    def set_positions(self, x, y):
+        self.x[:] = x
+        self.y[:] = y
+
+    def __getitem__(self, index):
+        return self.views[index]
+
+    def __iter__(self):
+        return iter(self.views)
+
+    def __len__(self):
+        return len(self.views)
+
+def overlaps(left, top, right, bottom, rect):
+    """Vectorized Rect.colliderect of the given edge arrays against rect."""
+    return (left < rect.right) & (right > rect.left) & (top < rect.bottom) & (bottom > rect.top)
+
+# Shared overlay surfaces, built once per process on first use
+_cone_sprites = {}
+_alert_bars = {}
+
+def cone_sprite(direction):
+    """Return (surface, apex) for the vision cone facing direction.
+
+    The surface is cropped to the cone's bounding box and apex is the cone's
+    tip in surface coordinates.
+    """
+    if direction not in _cone_sprites:
+        facing = direction * 180
+        points = [(0.0, 0.0)]
+        for half_angle in (-VISION_CONE_ANGLE/2, VISION_CONE_ANGLE/2):
+            angle = math.radians(facing + half_angle)
+            points.append((
+                VISION_CONE_LENGTH * math.cos(angle),
+                -VISION_CONE_LENGTH * math.sin(angle)
+            ))
+        left = math.floor(min(x for x, _ in points))
+        top = math.floor(min(y for _, y in points))
+        width = math.ceil(max(x for x, _ in points)) - left + 1
+        height = math.ceil(max(y for _, y in points)) - top + 1
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.polygon(surface, (*NEON_PINK, 50), [(x - left, y - top) for x, y in points])
+        _cone_sprites[direction] = (surface, (-left, -top))
+    return _cone_sprites[direction]
+
+def alert_bar(width):
+    if width not in _alert_bars:
+        bar = pygame.Surface((width, 20), pygame.SRCALPHA)
+        bar.fill((255, 0, 0, 150))
+        _alert_bars[width] = bar
+    return _alert_bars[width]
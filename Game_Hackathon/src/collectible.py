@@ -1,18 +1,26 @@
 import pygame
-import os
-from constants import IMAGES_PATH, TILE_SIZE
+from constants import TILE_SIZE
+from assets import asset_cache
+from collision import image_mask
 
 class Collectible(pygame.sprite.Sprite):
     def __init__(self, x, y, item_type):
         super().__init__()
         self.item_type = item_type
-        self.image = pygame.image.load(os.path.join(IMAGES_PATH, f"{item_type}.png")).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (TILE_SIZE, TILE_SIZE))  # scale it
+        self.image = asset_cache.image(*self.image_key(item_type))  # shared, pre-scaled
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
         self.collected = False
 
+    @property
+    def mask(self):
+        return image_mask(self.image)
+
+    @staticmethod
+    def image_key(item_type):
+        return (f"{item_type}.png", (TILE_SIZE, TILE_SIZE), True)
+
     def draw(self, screen, camera):
         if not self.collected:
             screen.blit(self.image, (self.rect.x - camera.offset.x, self.rect.y - camera.offset.y))
@@ -0,0 +1,53 @@
+# File: src/collision.py
+import weakref
+
+import pygame
+from constants import MAX_MASK_CHECKS
+
+# surface -> {threshold: mask}, built on first use. Weakly keyed, so a mask
+# goes away with its surface when the asset cache evicts it.
+_masks = weakref.WeakKeyDictionary()
+
+def image_mask(surface, threshold=127):
+    """The cached mask of the pixels in surface with alpha above threshold.
+
+    Sprites share surfaces, so they share masks too.
+    """
+    masks = _masks.get(surface)
+    if masks is None:
+        masks = _masks[surface] = {}
+    mask = masks.get(threshold)
+    if mask is None:
+        mask = masks[threshold] = pygame.mask.from_surface(surface, threshold)
+    return mask
+
+class MaskCollider:
+    """Pixel-accurate overlap tests with a rect prefilter and a per-tick budget.
+
+    Pairs whose rects don't touch never reach a mask test, and at most
+    budget mask tests run between two calls to new_tick(). Past the budget
+    a test returns its fallback (the answer the rect/point check would have
+    given), so a crowded tick costs no more than a fixed number of masks.
+    """
+    def __init__(self, budget=MAX_MASK_CHECKS):
+        self.budget = budget
+        self.checks = 0          # mask tests since the last new_tick()
+        self.total_checks = 0
+        self.over_budget = 0     # tests answered with their fallback
+
+    def new_tick(self):
+        self.checks = 0
+
+    def overlap(self, rect, mask, other_rect, other_mask, fallback=True):
+        """Do mask at rect and other_mask at other_rect (same space) share a pixel?"""
+        if not rect.colliderect(other_rect):
+            return False
+        if self.checks >= self.budget:
+            self.over_budget += 1
+            return fallback
+        self.checks += 1
+        self.total_checks += 1
+        return mask.overlap(other_mask, (other_rect.x - rect.x, other_rect.y - rect.y)) is not None
+
+    def stats(self):
+        return {"checks": self.total_checks, "over_budget": self.over_budget, "budget": self.budget}
@@ -5,9 +5,23 @@ ASSETS_DIR    = os.path.join(os.path.dirname(__file__), 'assets')
 EFFECTS_PATH  = os.path.join(ASSETS_DIR, 'sounds', 'Effects')
 MUSIC_PATH    = os.path.join(ASSETS_DIR, 'sounds', 'Music')
 IMAGES_PATH   = os.path.join(ASSETS_DIR, 'Images')
+LEVELS_PATH   = os.path.join(ASSETS_DIR, 'levels')
 
 SCREEN_WIDTH  = 800
 SCREEN_HEIGHT = 600
+FPS           = 60   # render frame cap
+# Simulation ticks per second. Speeds, gravity, jump strength and animation
+# steps are tuned per tick at this rate (positions are whole pixels, so they
+# can't be rescaled exactly); it is fixed, not a setting
+TICK_RATE     = 60
+MAX_CATCHUP_STEPS = 5   # ticks run at most per frame after a stall
+# Repaint only changed regions instead of flipping the whole screen each
+# frame (for low-power displays); set RETRO_RUNWAY_DIRTY_RECTS=1 to enable
+DIRTY_RECTS   = os.environ.get('RETRO_RUNWAY_DIRTY_RECTS') == '1'
+# Pixel-accurate pickups and vision cones, tested against sprite masks; set
+# RETRO_RUNWAY_PIXEL_COLLISION=1 to enable
+PIXEL_COLLISION = os.environ.get('RETRO_RUNWAY_PIXEL_COLLISION') == '1'
+MAX_MASK_CHECKS = 16   # mask tests per tick before falling back to rects
 GRAVITY       = 0.75
 JUMP_STRENGTH = -15
 PLAYER_SPEED  = 5
@@ -15,13 +29,33 @@ BOUNCER_SPEED = 2
 VISION_CONE_ANGLE  = 60
 VISION_CONE_LENGTH = 300
 DISCO_DURATION     = 5000
+ALERT_DURATION     = 1000   # ms a bouncer stays alerted after spotting the player
 TILE_SIZE     = 64
+SPATIAL_CELL_SIZE  = TILE_SIZE * 2  # world px per spatial hash cell
+ASSET_CACHE_BUDGET = 64 * 1024 * 1024  # bytes of decoded surfaces kept resident
+TEXT_CACHE_SIZE    = 256  # rendered strings kept by the text cache
+LAYOUT_CACHE_SIZE  = 32   # generated level layouts kept, keyed by (level, seed)
+PREFETCH_THRESHOLD = 0.5  # share of a level's items collected before the next level is built
+
+# Sound effects share a few reserved mixer channels; higher priority effects
+# may cut off lower ones, and repeats closer than the interval are dropped
+EFFECT_CHANNELS     = 4
+EFFECT_PRIORITIES   = {'hit': 3, 'game_over': 3, 'victory': 2, 'power_up': 1, 'collect': 1}
+EFFECT_MIN_INTERVAL = 80   # ms between two plays of the same effect
+
+# Music tracks are decoded in the background, kept resident within a byte
+# budget and crossfaded on their own two reserved channels
+MUSIC_CHANNELS      = 2
+MUSIC_CROSSFADE_MS  = 800
+MUSIC_CACHE_BUDGET  = 48 * 1024 * 1024
 
 NEON_PINK     = (255,20,147)
 DISCO_BLUE    = (30,144,255)
 RETRO_YELLOW  = (255,255,0)
 BLACK         = (0,0,0)
 
+HUD_RECT      = (0, 0, SCREEN_WIDTH, 85)  # score, outfit slots, disco balls
+
 OUTFIT_ORDER = ['Bell-Bottom','Disco-Shirt','Sunglasses','Shoe','hair']
 
 LEVELS = [
@@ -31,6 +65,7 @@ LEVELS = [
       'music': 'level1_theme.mp3',
       'enemies': 3,
       'collectibles': ['Bell-Bottom','Disco-Shirt'],
+      'tilemap': 'parking_lot.map',
       # parking lot uses cars by name
     },
     {
@@ -39,6 +74,7 @@ LEVELS = [
       'music': 'level2_theme.mp3',
       'enemies': 5,
       'collectibles': ['Sunglasses','Shoe','hair'],
+      'tilemap': 'nightclub.map',
       # explicitly request cars here as well
       'hiding_spots': 'cars'
     }
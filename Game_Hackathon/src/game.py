@@ -2,53 +2,145 @@ import pygame
 import sys
 import os
 import random
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from player import Player
-from level import Level
+from level import Level, level_assets
+from vision import spot_player
 from constants import *
+from assets import asset_cache
+from collision import MaskCollider
+from text_cache import text_cache
 from sound_manager import SoundManager
 
+# Keys that fire an action once per tick they are pressed, as opposed to the
+# movement keys that act for as long as they are held
+TRIGGER_KEYS = (pygame.K_UP, pygame.K_SPACE, pygame.K_LSHIFT, pygame.K_r)
+HELD_KEYS    = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_DOWN)
+
+class KeyState(frozenset):
+    """Set of key codes that answers keys[pygame.K_x] like key.get_pressed()."""
+    def __getitem__(self, key):
+        return key in self
+
+class LiveInput:
+    """Feeds the keyboard to Game.step one tick at a time.
+
+    Trigger keys pressed between ticks are queued and delivered with the
+    next tick, and held keys are sampled as each tick runs, so live play
+    goes through exactly the inputs a replay will. Each tick's inputs are
+    also passed to recorder (a replay.Recorder) when one is given.
+    """
+    def __init__(self, recorder=None):
+        self.recorder = recorder
+        self.triggers = set()   # pressed since the last tick
+
+    def key_down(self, key):
+        if key in TRIGGER_KEYS:
+            self.triggers.add(key)
+
+    def step(self, game):
+        pressed = pygame.key.get_pressed()
+        inputs = self.triggers.union(key for key in HELD_KEYS if pressed[key])
+        self.triggers.clear()
+        if self.recorder:
+            self.recorder.record(inputs)
+        return game.step(inputs)
+
+    def close(self, game):
+        """Finish the recording, if any, with game's final state."""
+        if self.recorder:
+            self.recorder.close(game)
+
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, levels=LEVELS, dirty_rects=DIRTY_RECTS, seed=None,
+                 sound_manager=None, pixel_collision=PIXEL_COLLISION):
+        # Headless runs use SDL's dummy drivers: surfaces still load and
+        # convert, but nothing opens a window or touches the sound card
+        self.headless = headless
+        self.levels = levels
+        self.dirty_rects = dirty_rects
+        # Mask tests for pickups and vision, or None for rect/point checks
+        self.collider = MaskCollider() if pixel_collision else None
+        # One seed per session; each level derives its layout from it, so a
+        # restart replays the same layouts
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
         pygame.mixer.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
+        flags = 0 if headless else pygame.FULLSCREEN
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags)
         pygame.display.set_caption("Retro Runway")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
-        self.sound_manager = SoundManager()
-        self.current_level = 0
-        self.level = Level(LEVELS[self.current_level])
-        self.player = Player(100, SCREEN_HEIGHT - 250)
-        self.camera = Camera()
-        self.camera.set_level_width(SCREEN_WIDTH * 2)
-        self.score = 0
-        self.game_state = "playing"
-        # Play level music (strip .mp3)
-        self.sound_manager.play_music(self.level.music.replace('.mp3',''))
+        # Decode every level's sprites once so level construction never hits the disk
+        for level_data in self.levels:
+            asset_cache.preload(level_assets(level_data))
+        # Reuse the caller's manager (and its music state) when given one
+        self.sound_manager = sound_manager or SoundManager(enabled=not headless)
+        # The next level is built on a worker thread while this one is played
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-prefetch")
+        self._next_level = None   # Future of the prefetched Level
+        self.last_transition_ms = None
 
-        # Load background image
+        # Load background image, tiled once into a screen-sized surface
         try:
-            self.bg_image = pygame.image.load(
-                os.path.join(ASSETS_DIR, "Images", "background.png")
-            ).convert()
-            self.bg_rect = self.bg_image.get_rect()
+            bg_image = asset_cache.image("background.png", alpha=False)
+            self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            for x in range(0, SCREEN_WIDTH, bg_image.get_width()):
+                for y in range(0, SCREEN_HEIGHT, bg_image.get_height()):
+                    self.background.blit(bg_image, (x, y))
         except FileNotFoundError:
-            self.bg_image = None
-            self.bg_rect = None
+            self.background = None
 
         # Load win and lose screens
-        self.win_image = pygame.image.load(
-            os.path.join(ASSETS_DIR, "Images", "win_screen.png")
-        ).convert()
-        self.win_image = pygame.transform.scale(self.win_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.win_image = asset_cache.image("win_screen.png", (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
+        self.lose_image = asset_cache.image("lost_screen.png", (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
 
-        self.lose_image = pygame.image.load(
-            os.path.join(ASSETS_DIR, "Images", "lost_screen.png")
-        ).convert()
-        self.lose_image = pygame.transform.scale(self.lose_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        # The first level is kept so restarts only reset it rather than rebuild it
+        self._first_level = Level(self.levels[0], self.seed)
+        self.player = Player(100, SCREEN_HEIGHT - 250)
+        self.camera = Camera()
+        self.current_level = 0
+        self.reset()
+
+    def reset(self):
+        """Start over from the first level.
+
+        Only gameplay state is reset (score, player, level entities, timers);
+        the display, fonts, sounds and loaded surfaces are kept.
+        """
+        if self.current_level != 0:
+            # A prefetch still pending from level 0 is the level we need next
+            self._next_level = None
+        self.ticks = 0
+        self.current_level = 0
+        self.level = self._first_level
+        self.level.reset()
+        self.player.reset(100, SCREEN_HEIGHT - 250)
+        self.camera.offset.update(0, 0)
+        self.camera.set_level_width(self.level.width)
+        self.score = 0
+        self.game_state = "playing"
+        self.draw_stats = {"drawn": 0, "culled": 0}  # per-frame culling counters
+        # Positions at the start of the current tick, for render interpolation
+        self._snapshot()
+        # What the last frame put on screen, for dirty-rect rendering
+        self._drawn_scene = None
+        self._display_list_drawn = {}
+        # Play level music (strip .mp3)
+        self.sound_manager.play_music(self.level.music.replace('.mp3',''))
 
         # Delay bouncer activation
-        self.collision_delay = pygame.time.get_ticks() + 2000
+        self.collision_delay = self.now() + 2000
+
+    def now(self):
+        """Game time in ms, counted in simulation ticks rather than wall time."""
+        return self.ticks * 1000 // TICK_RATE
 
     def handle_events(self):
         for event in pygame.event.get():
@@ -56,43 +148,96 @@ class Game:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    self.check_collectibles()
-                elif event.key == pygame.K_SPACE:
-                    self.player.jump()
-                elif event.key == pygame.K_LSHIFT:
-                    self.player.activate_disco()
-                elif event.key == pygame.K_r and self.game_state != "playing":
-                    # restart the game
-                    self.__init__()
+                self.handle_key(event.key)
+
+    def handle_key(self, key):
+        if key == pygame.K_UP:
+            self.check_collectibles()
+        elif key == pygame.K_SPACE:
+            self.player.jump()
+        elif key == pygame.K_LSHIFT:
+            self.player.activate_disco()
+        elif key == pygame.K_r and self.game_state != "playing":
+            # restart the game, keeping everything already loaded
+            self.reset()
+
+    def step(self, inputs=()):
+        """Advance the game by one tick without drawing, flipping or waiting.
+
+        inputs holds the pygame key codes active this tick. Movement keys act
+        while present; TRIGGER_KEYS fire once for each tick they appear in.
+        """
+        keys = KeyState(inputs)
+        # Triggers and the update share one tick's mask budget
+        self._new_tick()
+        for key in TRIGGER_KEYS:
+            if keys[key]:
+                self.handle_key(key)
+        self._tick(keys)
+        return self.game_state
+
+    def _new_tick(self):
+        if self.collider:
+            self.collider.new_tick()
 
     def check_collectibles(self):
-        for c in self.level.collectibles:
-            if pygame.sprite.collide_rect(self.player, c):
-                if c.item_type == "Disco-Ball":
-                    self.player.disco_count += 1
-                else:
-                    self.player.add_outfit_piece(c.item_type)
-                self.score += 1000
-                c.collected = True
-                self.sound_manager.play_sound("collect")
-
-    def update(self):
-        if self.game_state != "playing":
-            return
+        for c in self.touching_collectibles():
+            if c.item_type == "Disco-Ball":
+                self.player.disco_count += 1
+            else:
+                self.player.add_outfit_piece(c.item_type)
+            self.score += 1000
+            c.collected = True
+            self.sound_manager.play_sound("collect")
+        if self.level_progress() >= PREFETCH_THRESHOLD:
+            self.prefetch_next_level()
 
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            self.player.rect.x -= PLAYER_SPEED
-        if keys[pygame.K_RIGHT]:
-            self.player.rect.x += PLAYER_SPEED
-        if keys[pygame.K_DOWN]:
-            self.player.crouch(True)
+    def touching_collectibles(self):
+        """Collectibles the player is touching: rect overlap, then masks if enabled."""
+        if self.collider is None:
+            return self.level.collectible_grid.colliding(self.player.rect)
+        body, mask = self.player.draw_rect(), self.player.mask
+        return [
+            c for c in self.level.collectible_grid.colliding(body)
+            if self.collider.overlap(body, mask, c.rect, c.mask)
+        ]
+
+    def level_progress(self):
+        """Share of the current level's outfit pieces collected so far."""
+        items = [c for c in self.level.collectibles if c.item_type != "Disco-Ball"]
+        if not items:
+            return 1.0
+        return sum(c.collected for c in items) / len(items)
+
+    def prefetch_next_level(self):
+        """Start building the next Level (and reading its music) in the background."""
+        index = self.current_level + 1
+        if self._next_level is not None or index > len(self.levels):
+            return
+        if index == len(self.levels):
+            # Last level: only the victory music is left to read ahead
+            self._next_level = self._prefetch_pool.submit(self.sound_manager.prefetch_music, "victory_theme")
         else:
-            self.player.crouch(False)
+            self._next_level = self._prefetch_pool.submit(self._build_level, self.levels[index])
+
+    def _build_level(self, level_data):
+        self.sound_manager.prefetch_music(level_data["music"].replace('.mp3',''))
+        return Level(level_data, self.seed)
+
+    def update(self, keys=None):
+        """Advance the simulation by one fixed tick (1/TICK_RATE s)."""
+        self._new_tick()
+        self._tick(keys)
+
+    def _tick(self, keys):
+        self._snapshot()
+        self.ticks += 1
+        if self.game_state != "playing":
+            return
 
-        self.player.update(self.level.platforms)
-        self.player.rect.x = max(0, min(self.player.rect.x, SCREEN_WIDTH * 2 - self.player.rect.width))
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        self.update_player(keys)
 
         # 1) Check for level completion before any bouncer can tag you
         self.check_level_completion()
@@ -100,81 +245,201 @@ class Game:
             return
 
         # 2) Enemy collisions (only if still playing)
-        if pygame.time.get_ticks() > self.collision_delay:
-            for enemy in self.level.enemies:
-                enemy.update()
-                hiding = (
-                    self.player.crouching
-                    and pygame.sprite.spritecollideany(self.player, self.level.hiding_spots)
-                )
-                if enemy.check_vision(self.player) and not self.player.disco_active and not hiding:
-                    self.sound_manager.play_sound("hit")
-                    self.game_state = "game_over"
-                    return
+        self.update_enemies()
+        if self.game_state != "playing":
+            return
 
         # 3) Update camera last
         self.camera.update(self.player)
 
+    def update_player(self, keys):
+        if keys[pygame.K_LEFT]:
+            self.player.rect.x -= PLAYER_SPEED
+        if keys[pygame.K_RIGHT]:
+            self.player.rect.x += PLAYER_SPEED
+        if keys[pygame.K_DOWN]:
+            self.player.crouch(True)
+        else:
+            self.player.crouch(False)
+
+        self.player.update(self.level.platform_grid)
+        self.player.rect.x = max(0, min(self.player.rect.x, self.level.width - self.player.rect.width))
+
+    def update_enemies(self):
+        if self.now() > self.collision_delay:
+            self.level.enemies.update()
+            # Every cone is tested against the player in one batched pass
+            if spot_player(self.level.enemies, self.player, self.collider):
+                self.sound_manager.play_sound("hit")
+                self.game_state = "game_over"
+
     def check_level_completion(self):
         remaining = [
             c for c in self.level.collectibles
             if not c.collected and c.item_type != "Disco-Ball"
         ]
         if not remaining:
+            start = time.perf_counter()
+            self.prefetch_next_level()   # no-op if it is already built or building
             self.current_level += 1
-            if self.current_level < len(LEVELS):
+            if self.current_level < len(self.levels):
                 self.sound_manager.play_sound("victory")
-                self.level = Level(LEVELS[self.current_level])
+                # Usually ready by now; otherwise this waits for the worker
+                self.level = self._next_level.result()
+                self._next_level = None
+                self.camera.set_level_width(self.level.width)
                 self.player.rect.x = 100
                 self.player.rect.y = SCREEN_HEIGHT - 250
                 self.sound_manager.play_music(self.level.music.replace('.mp3',''))
-                self.collision_delay = pygame.time.get_ticks() + 2000
+                self.collision_delay = self.now() + 2000
+                # Don't interpolate across the jump to the new level: the
+                # camera has to follow the player there before the snapshot
+                self.camera.update(self.player)
+                self._snapshot()
+                self.last_transition_ms = (time.perf_counter() - start) * 1000
             else:
                 # no more levels → victory!
                 self.game_state = "victory"
                 self.sound_manager.play_music("victory_theme")
 
-    def draw(self):
-        # Win / lose screens override normal level draw
-        if self.game_state == "game_over":
-            self.screen.blit(self.lose_image, (0, 0))
-            pygame.display.flip()
+    def _snapshot(self):
+        self._previous_positions = [(self.player, self.player.rect.topleft)]
+        self._previous_enemies = self.level.enemies.positions()
+        self._previous_offset = pygame.math.Vector2(self.camera.offset)
+
+    @contextmanager
+    def _interpolated(self, alpha):
+        """Move the player, bouncers and camera alpha of the way from their
+        previous tick's positions to their current ones for the duration of a
+        draw, then put them back."""
+        if alpha >= 1:
+            yield
+            return
+        current = [(sprite, sprite.rect.topleft) for sprite, _ in self._previous_positions]
+        enemies = self.level.enemies
+        current_enemies = enemies.positions()
+        current_offset = pygame.math.Vector2(self.camera.offset)
+        for sprite, (px, py) in self._previous_positions:
+            x, y = sprite.rect.topleft
+            sprite.rect.topleft = (round(px + (x - px) * alpha), round(py + (y - py) * alpha))
+        enemies.set_positions(*(
+            np.round(previous + (now - previous) * alpha)
+            for previous, now in zip(self._previous_enemies, current_enemies)
+        ))
+        offset = self._previous_offset.lerp(current_offset, alpha)
+        self.camera.offset = pygame.math.Vector2(round(offset.x), round(offset.y))
+        try:
+            yield
+        finally:
+            for sprite, topleft in current:
+                sprite.rect.topleft = topleft
+            enemies.set_positions(*current_enemies)
+            self.camera.offset = current_offset
+
+    def draw(self, alpha=1.0):
+        """Render the game; alpha is how far into the next tick this frame falls."""
+        with self._interpolated(alpha):
+            self._draw()
+
+    def _draw(self):
+        # Win / lose screens override normal level draw; in dirty-rect mode
+        # they are static, so they are only pushed once
+        if self.game_state in ("game_over", "victory"):
+            if not self.dirty_rects or self._drawn_scene != self.game_state:
+                image = self.lose_image if self.game_state == "game_over" else self.win_image
+                self.screen.blit(image, (0, 0))
+                pygame.display.flip()
+            self._drawn_scene = self.game_state
             return
-        if self.game_state == "victory":
-            self.screen.blit(self.win_image, (0, 0))
+
+        self.draw_stats = {"drawn": 0, "culled": 0}
+        if not self.dirty_rects:
+            self.draw_scene(self.screen.get_rect())
             pygame.display.flip()
             return
 
-        # Normal level rendering
-        if self.bg_image:
-            for x in range(0, SCREEN_WIDTH, self.bg_rect.width):
-                for y in range(0, SCREEN_HEIGHT, self.bg_rect.height):
-                    self.screen.blit(self.bg_image, (x, y))
+        # Dirty-rect mode: the static world only moves when the camera
+        # scrolls, so anything else repaints just the regions that changed
+        scene = (self.level, tuple(self.camera.offset))
+        display_list = self._display_list()
+        if self._drawn_scene != scene:
+            self.draw_scene(self.screen.get_rect())
+            pygame.display.flip()
+        else:
+            dirty = []
+            for key in display_list.keys() | self._display_list_drawn.keys():
+                before, after = self._display_list_drawn.get(key), display_list.get(key)
+                if before != after:
+                    dirty.extend(entry[0] for entry in (before, after) if entry)
+            dirty = merge_rects(r.clip(self.screen.get_rect()) for r in dirty)
+            for region in dirty:
+                self.screen.set_clip(region)
+                self.draw_scene(region)
+            self.screen.set_clip(None)
+            if dirty:
+                pygame.display.update(dirty)
+        self._drawn_scene = scene
+        self._display_list_drawn = display_list
+
+    def draw_scene(self, region):
+        """Draw the background, world and HUD that fall inside region (screen space)."""
+        # The background is anchored to the screen, not the world
+        if self.background:
+            self.screen.blit(self.background, region, region)
         else:
-            self.screen.fill(BLACK)
-
-        for p in self.level.platforms:
-            self.screen.blit(p.image, (
-                p.rect.x - self.camera.offset.x,
-                p.rect.y - self.camera.offset.y
-            ))
-        for h in self.level.hiding_spots:
-            self.screen.blit(h.image, (
-                h.rect.x - self.camera.offset.x,
-                h.rect.y - self.camera.offset.y
-            ))
-        for c in self.level.collectibles:
+            self.screen.fill(BLACK, region)
+
+        # Only entities intersecting the camera's view are drawn
+        view = region.move(self.camera.offset.x, self.camera.offset.y)
+        layer = self.level.static_layer
+        drawn = layer.draw(self.screen, view, self.camera.offset)
+        self.draw_stats["drawn"] += drawn
+        self.draw_stats["culled"] += len(layer) - drawn
+        for c in self._visible(self.level.collectible_grid, view):
             c.draw(self.screen, self.camera)
-        for e in self.level.enemies:
-            e.draw_vision_cone(self.screen, self.camera)
-            e.draw(self.screen, self.camera)
+        # Bouncers move, so they are culled from the manager's arrays rather than a grid
+        enemies = self.level.enemies
+        cones, bodies = enemies.visible(view)
+        shown = int(cones.sum() + bodies.sum())
+        self.draw_stats["drawn"] += shown
+        self.draw_stats["culled"] += 2 * len(enemies) - shown
+        for i in np.flatnonzero(cones | bodies):
+            e = enemies[i]
+            if cones[i]:
+                e.draw_vision_cone(self.screen, self.camera)
+            if bodies[i]:
+                e.draw(self.screen, self.camera)
+
+        if self.player.draw_rect().colliderect(view):
+            self.player.draw(self.screen, self.camera)
+        if region.colliderect(HUD_RECT):
+            self.draw_hud()
 
-        self.player.draw(self.screen, self.camera)
-        self.draw_hud()
-        pygame.display.flip()
+    def _display_list(self):
+        """Screen rect and appearance of everything that can change between frames."""
+        offset = (-self.camera.offset.x, -self.camera.offset.y)
+        entries = {
+            "player": (self.player.draw_rect().move(offset), id(self.player.composite()[0])),
+            "hud": (pygame.Rect(HUD_RECT), self.score, frozenset(self.player.outfit), self.player.disco_count),
+        }
+        cones, bodies = self.level.enemies.visible(self.camera.view_rect())
+        for i in np.flatnonzero(cones | bodies):
+            e = self.level.enemies[i]
+            rect = e.draw_rect().union(e.vision_rect()).move(offset)
+            entries[id(e)] = (rect, id(e.image), e.alerted)
+        for c in self.level.collectible_grid.colliding(self.camera.view_rect()):
+            if not c.collected:
+                entries[id(c)] = (c.rect.move(offset),)
+        return entries
+
+    def _visible(self, grid, view):
+        visible = grid.colliding(view)
+        self.draw_stats["drawn"] += len(visible)
+        self.draw_stats["culled"] += len(grid) - len(visible)
+        return visible
 
     def draw_hud(self):
-        score_text = self.font.render(f"Score: {self.score}", True, RETRO_YELLOW)
+        score_text = text_cache.render(self.font, f"Score: {self.score}", True, RETRO_YELLOW)
         self.screen.blit(score_text, (10, 10))
         for i, item in enumerate(OUTFIT_ORDER):
             color = DISCO_BLUE if item in self.player.outfit else NEON_PINK
@@ -190,24 +455,89 @@ class Game:
                 15
             )
 
+def merge_rects(rects):
+    """Union overlapping rects so each screen region is repainted once."""
+    merged = []
+    for rect in rects:
+        if not rect.width or not rect.height:
+            continue
+        i = 0
+        while i < len(merged):
+            if merged[i].colliderect(rect):
+                rect = rect.union(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
+
 class Camera:
     def __init__(self):
         self.offset = pygame.math.Vector2(0, 0)
 
     def update(self, player):
         target_x = player.rect.centerx - SCREEN_WIDTH//2
-        self.offset.x = max(0, min(target_x, SCREEN_WIDTH*2 - SCREEN_WIDTH))
+        self.offset.x = max(0, min(target_x, self.level_width - SCREEN_WIDTH))
 
     def set_level_width(self, level_width):
         self.level_width = level_width
 
+    def view_rect(self):
+        """The world-space rectangle currently on screen."""
+        return pygame.Rect(self.offset.x, self.offset.y, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+class FixedTimestep:
+    """Turns elapsed wall time into a whole number of fixed simulation ticks.
+
+    Leftover time carries over to the next frame and becomes the render
+    interpolation factor. After a long stall at most max_steps ticks are run
+    and the rest of the backlog is dropped, so the game never spirals.
+    """
+    def __init__(self, tick_rate=TICK_RATE, max_steps=MAX_CATCHUP_STEPS):
+        self.dt = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.reset()
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.last = time.perf_counter()
+
+    def advance(self):
+        """Number of ticks to simulate for the time since the last call."""
+        now = time.perf_counter()
+        self.accumulator += now - self.last
+        self.last = now
+        steps = int(self.accumulator // self.dt)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = self.dt * steps
+        self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.dt
+
 def main():
+    from replay import session_recorder
     game = Game()
-    while True:
-        game.handle_events()
-        game.update()
-        game.draw()
-        game.clock.tick(60)
+    live_input = LiveInput(session_recorder(game))
+    timestep = FixedTimestep()
+    try:
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+                if event.type == pygame.KEYDOWN:
+                    live_input.key_down(event.key)
+            for _ in range(timestep.advance()):
+                live_input.step(game)
+            game.draw(timestep.alpha)
+            game.sound_manager.update()
+            game.clock.tick(FPS)
+    finally:
+        live_input.close(game)
+        pygame.quit()
 
 if __name__ == "__main__":
     main()
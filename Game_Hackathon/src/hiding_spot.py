@@ -1,11 +1,10 @@
 import pygame
-import os
-from constants import IMAGES_PATH
+from assets import asset_cache
 
 class HidingSpot(pygame.sprite.Sprite):
     def __init__(self, x, y, asset):
         super().__init__()
-        self.image = pygame.image.load(os.path.join(IMAGES_PATH, asset)).convert_alpha()
+        self.image = asset_cache.image(asset)
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
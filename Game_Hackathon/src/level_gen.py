@@ -0,0 +1,130 @@
+# File: src/level_gen.py
+import random
+import threading
+from collections import OrderedDict, namedtuple
+
+import pygame
+from assets import asset_cache
+from collectible import Collectible
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, LAYOUT_CACHE_SIZE
+
+CAR_ASSETS   = ["car1.png", "car2.png", "car3.png"]
+CHAIN_ASSETS = ["Chain.png"]
+
+# Where everything in a level starts: lists of (x, y, asset), (x, y, patrol
+# points) and (x, y, item type)
+Layout = namedtuple("Layout", "hiding_spots bouncers collectibles")
+
+def uses_cars(level_data):
+    return level_data.get('hiding_spots') == 'cars' or 'Parking' in level_data["name"]
+
+def free_intervals(low, high, width, blocked):
+    """Inclusive (start, end) ranges of x in [low, high] where a width px wide
+    span overlaps none of the blocked rects."""
+    spans = sorted((rect.left - width + 1, rect.right - 1) for rect in blocked)
+    free, start = [], low
+    for first, last in spans:
+        if first > start:
+            free.append((start, min(first - 1, high)))
+        start = max(start, last + 1)
+        if start > high:
+            break
+    if start <= high:
+        free.append((start, high))
+    return [(a, b) for a, b in free if a <= b]
+
+def sample(rng, intervals):
+    """Uniform x from the union of intervals, or None if they are empty."""
+    total = sum(b - a + 1 for a, b in intervals)
+    if not total:
+        return None
+    pick = rng.randrange(total)
+    for a, b in intervals:
+        if pick <= b - a:
+            return a + pick
+        pick -= b - a + 1
+
+def obstacles(platforms, y, height, width):
+    """Rects of the platforms crossing the band of rows y..y+height."""
+    return [p.rect for p in platforms.colliding(pygame.Rect(0, y, width, height))]
+
+def generate_layout(level_data, seed, width, platforms):
+    """Place a level's entities from seed alone.
+
+    Every position is drawn straight from the free x ranges along the row
+    the entity sits on, so nothing is ever retried: an entity is only
+    skipped when its row has no room at all.
+    """
+    rng = random.Random(f"{level_data['name']}/{seed}")
+
+    # Hiding spots (cars vs chains) and bouncers start anywhere but the last screen
+    asset_list = CAR_ASSETS if uses_cars(level_data) else CHAIN_ASSETS
+    y_pos = SCREEN_HEIGHT - 150 if uses_cars(level_data) else SCREEN_HEIGHT - 120
+    spread = max(100, width - SCREEN_WIDTH - 100)
+    hiding_spots = []
+    for _ in range(level_data.get("hiding_spot_count", 3)):
+        hiding_spots.append((rng.randint(100, spread), y_pos, rng.choice(asset_list)))
+
+    bouncers = []
+    y = SCREEN_HEIGHT - TILE_SIZE - 50
+    free = free_intervals(100, spread, TILE_SIZE, obstacles(platforms, y, TILE_SIZE, width))
+    turn = max(0, width - SCREEN_WIDTH)
+    for _ in range(level_data["enemies"]):
+        x = sample(rng, free)
+        if x is None:
+            print("Warning: Could not place bouncer.")
+            break
+        bouncers.append((x, y, [(rng.randint(0, turn), y), (rng.randint(turn, width), y)]))
+
+    # Collectibles stay clear of platforms and hiding spots
+    collectibles = []
+    y = SCREEN_HEIGHT - 250
+    blocked = obstacles(platforms, y, TILE_SIZE, width) + [
+        pygame.Rect((x, y_pos), asset_cache.image(asset).get_size())
+        for x, y_pos, asset in hiding_spots
+    ]
+    for it in level_data["collectibles"]:
+        item_width, item_height = Collectible.image_key(it)[1]
+        band = [r for r in blocked if r.top < y + item_height and r.bottom > y]
+        x = sample(rng, free_intervals(100, width - 100, item_width, band))
+        if x is None:
+            print(f"Warning: Could not place {it}.")
+            continue
+        collectibles.append((x, y, it))
+
+    # Disco ball (optional)
+    if rng.random() > 0.5:
+        collectibles.append((rng.randint(100, width - 100), SCREEN_HEIGHT - 200, "Disco-Ball"))
+
+    return Layout(hiding_spots, bouncers, collectibles)
+
+# Generated layouts, most recently used last, keyed by layout_key()
+_layouts = OrderedDict()
+_layouts_lock = threading.Lock()   # levels are also built on the prefetch thread
+
+def layout_key(level_data, seed, width, platforms):
+    """Everything generate_layout reads, so differing levels never share a layout.
+
+    Terrain is keyed by its collider rects rather than the tile map object,
+    since every Level loads its own copy.
+    """
+    return (
+        level_data["name"], seed, width, uses_cars(level_data),
+        level_data.get("hiding_spot_count", 3), level_data["enemies"],
+        tuple(level_data["collectibles"]),
+        tuple(tuple(p.rect) for p in platforms),
+    )
+
+def level_layout(level_data, seed, width, platforms):
+    """The layout for level_data and seed, generated on first use and then reused."""
+    key = layout_key(level_data, seed, width, platforms)
+    with _layouts_lock:
+        layout = _layouts.get(key)
+        if layout is None:
+            layout = generate_layout(level_data, seed, width, platforms)
+            _layouts[key] = layout
+            if len(_layouts) > LAYOUT_CACHE_SIZE:
+                _layouts.popitem(last=False)
+        else:
+            _layouts.move_to_end(key)
+        return layout
@@ -1,13 +1,21 @@
 # File: src/main.py
 
+import time
+_started = time.perf_counter()  # startup trace origin, before any heavy import
+
 import os
 import pygame
-from game import Game
 from ui import UI
-from sound_manager import SoundManager
+from sound_manager import SoundManager, sound_bank
 from constants import *
+from text_cache import text_cache
+from startup_trace import StartupTrace
+
+# Gameplay modules (game, level, bouncer, ...) are imported when a game starts
 
 def main():
+    trace = StartupTrace(_started)
+    trace.mark("import")
     pygame.init()
     try:
         screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
@@ -15,12 +23,20 @@ def main():
         screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Retro Runway")
     clock = pygame.time.Clock()
+    timestep = None
 
+    # One manager for menus and gameplay; effects decode in the background
     sound_manager = SoundManager()
+    sound_bank.preload()
+    trace.mark("init")
     ui = UI()
+    trace.mark("fonts")
     game = None
+    live_input = None   # LiveInput feeding (and maybe recording) the current game
     current_state = "menu"
     sound_manager.play_music("menu_theme")
+    # Starting a game is the next music change; decode its track meanwhile
+    sound_manager.prefetch_music(LEVELS[0]['music'].replace('.mp3',''))
 
     # Load menu background
     try:
@@ -32,80 +48,101 @@ def main():
         print(f"Error loading background image: {e}")
         menu_background = None
         bg_rect = None
+    trace.mark("assets")
 
     running = True
-    while running:
-        # **Pull all events once** per frame
-        events = pygame.event.get()
-        for event in events:
-            if event.type == pygame.QUIT:
-                running = False
-
-            # --- MENU STATE ---
-            if current_state == "menu":
-                # draw menu each event so click highlights smoothly
-                screen.fill(BLACK)
-                if menu_background:
-                    screen.blit(menu_background, (0, 0))
-                ui.draw_menu(screen)
-
-                result = ui.handle_input(event)
-                if result == "Start Game":
-                    current_state = "game"
-                    game = Game()
-                    sound_manager.stop_music()
-                elif result == "Controls":
-                    current_state = "controls"
-                elif result == "Quit":
+    shown_state = None
+    try:
+        while running:
+            redraw = False
+            # **Pull all events once** per frame
+            events = pygame.event.get()
+            for event in events:
+                if event.type == pygame.QUIT:
                     running = False
 
-            # --- GAME STATE ---
-            elif current_state == "game":
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        # back to menu
+                # --- MENU STATE ---
+                if current_state == "menu":
+                    # draw menu each event so click highlights smoothly
+                    screen.fill(BLACK)
+                    if menu_background:
+                        screen.blit(menu_background, (0, 0))
+                    ui.draw_menu(screen)
+                    redraw = True
+
+                    result = ui.handle_input(event)
+                    if result == "Start Game":
+                        current_state = "game"
+                        sound_manager.stop_music()
+                        from game import Game, FixedTimestep, LiveInput
+                        from replay import session_recorder
+                        game = Game(sound_manager=sound_manager)
+                        # Every tick goes through Game.step, so the session can be replayed
+                        live_input = LiveInput(session_recorder(game))
+                        timestep = FixedTimestep()  # don't try to catch up on the load
+                    elif result == "Controls":
+                        current_state = "controls"
+                    elif result == "Quit":
+                        running = False
+
+                # --- GAME STATE ---
+                elif current_state == "game":
+                    if event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_ESCAPE:
+                            # back to menu
+                            current_state = "menu"
+                            live_input.close(game)
+                            game = live_input = None
+                            sound_manager.play_music("menu_theme")
+                        else:
+                            # jump, collect, disco, restart: run on the next tick
+                            live_input.key_down(event.key)
+
+                # --- CONTROLS SCREEN ---
+                elif current_state == "controls":
+                    if event.type == pygame.KEYDOWN:
                         current_state = "menu"
-                        game = None
-                        sound_manager.play_music("menu_theme")
-                    elif event.key == pygame.K_SPACE:
-                        # jump
-                        game.player.jump()
-                    elif event.key == pygame.K_UP:
-                        # collect items
-                        game.check_collectibles()
-
-            # --- CONTROLS SCREEN ---
-            elif current_state == "controls":
-                if event.type == pygame.KEYDOWN:
-                    current_state = "menu"
-
-        # --- UPDATE & DRAW ---
-        if current_state == "game":
-            game.update()
-            game.draw()
-
-        elif current_state == "controls":
-            screen.fill(BLACK)
-            title = ui.font_large.render("CONTROLS", True, NEON_PINK)
-            screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 100))
-
-            controls = [
-                "Arrow Keys: Move",
-                "Down: Crouch/Hide",
-                "Space: Jump",
-                "Up: Collect Items",
-                "Shift: Activate Disco Power",
-                "ESC: Return to Menu"
-            ]
-            for i, c in enumerate(controls):
-                text = ui.font_small.render(c, True, DISCO_BLUE)
-                screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, 250 + i*40))
-
-            back = ui.font_small.render("Press any key to return", True, RETRO_YELLOW)
-            screen.blit(back, (SCREEN_WIDTH//2 - back.get_width()//2, 550))
-
-        pygame.display.flip()
-        clock.tick(60)
+
+            # --- UPDATE & DRAW ---
+            if current_state == "game":
+                for _ in range(timestep.advance()):
+                    live_input.step(game)
+                game.draw(timestep.alpha)
+
+            elif current_state == "controls" and (not DIRTY_RECTS or shown_state != "controls"):
+                # In dirty-rect mode the static controls screen is drawn once
+                redraw = True
+                screen.fill(BLACK)
+                title = text_cache.render(ui.font_large, "CONTROLS", True, NEON_PINK)
+                screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 100))
+
+                controls = [
+                    "Arrow Keys: Move",
+                    "Down: Crouch/Hide",
+                    "Space: Jump",
+                    "Up: Collect Items",
+                    "Shift: Activate Disco Power",
+                    "ESC: Return to Menu"
+                ]
+                for i, c in enumerate(controls):
+                    text = text_cache.render(ui.font_small, c, True, DISCO_BLUE)
+                    screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, 250 + i*40))
+
+                back = text_cache.render(ui.font_small, "Press any key to return", True, RETRO_YELLOW)
+                screen.blit(back, (SCREEN_WIDTH//2 - back.get_width()//2, 550))
+
+            # Game.draw presents its own frames; menus are pushed only when repainted
+            # if dirty-rect rendering is on
+            if current_state != "game" and (redraw or not DIRTY_RECTS):
+                pygame.display.flip()
+            shown_state = current_state
+            trace.frame_shown()
+            sound_manager.update()
+            clock.tick(FPS)
+    finally:
+        # A crash or quit mid-game still leaves a complete recording
+        if live_input:
+            live_input.close(game)
 
     pygame.quit()
 
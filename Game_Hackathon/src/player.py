@@ -1,17 +1,39 @@
 import pygame
-import os
-from constants import IMAGES_PATH, GRAVITY, JUMP_STRENGTH, OUTFIT_ORDER
+from constants import GRAVITY, JUMP_STRENGTH, OUTFIT_ORDER
+from assets import asset_cache
+
+# Surface.premul_alpha() needs pygame 2.1.4+; older versions composite with
+# plain alpha blits, which can differ slightly at soft overlay edges
+PREMULTIPLIED = hasattr(pygame.Surface, "premul_alpha")
+
+def layer_blit(dest, source, pos):
+    """Blit source onto dest the way the player composite is blended."""
+    if PREMULTIPLIED:
+        dest.blit(source, pos, special_flags=pygame.BLEND_PREMULTIPLIED)
+    else:
+        dest.blit(source, pos)
+
+def layer(surface):
+    return surface.premul_alpha() if PREMULTIPLIED else surface
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
         self.images = {}
         self.overlays = {}
-        self.current_sprite = 0
         self.load_sprites()
         self.load_overlays()
 
+        # (frame, outfit, direction) -> (surface, offset, mask); a frame is the
+        # base sprite surface itself
+        self.composites = {}
+        self.animation_speed = 0.15
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """Start over at (x, y) with no outfit, keeping the loaded sprites."""
         # Initial display image is the base idle sprite
+        self.current_sprite = 0
         self.image = self.images["idle"][0]
         self.rect  = self.image.get_rect(topleft=(x, y))
 
@@ -24,15 +46,11 @@ class Player(pygame.sprite.Sprite):
         self.disco_active = False
         self.disco_time   = 0
         self.disco_count  = 0
-
-        self.mask            = pygame.mask.from_surface(self.image)
-        self.animation_speed = 0.15
-        self.current_time    = 0
+        self.current_time = 0
 
     def load_sprites(self):
         """Safe sprite loading with fallbacks"""
-        base_image = self._load_image("Ideal_Character_State.png")
-        base_image = pygame.transform.scale(base_image, (100, 150))
+        base_image = self._load_image("Ideal_Character_State.png")  # already 100×150
 
         self.images = {
             "idle":   [base_image],
@@ -69,11 +87,7 @@ class Player(pygame.sprite.Sprite):
     def _load_image(self, filename, fallback=None):
         """Safe image loader with error fallback"""
         try:
-            path = os.path.join(IMAGES_PATH, filename)
-            img = pygame.image.load(path).convert_alpha()
-            if fallback is None:
-                img = pygame.transform.scale(img, (100, 150))
-            return img
+            return asset_cache.image(filename, None if fallback is not None else (100, 150))
         except (FileNotFoundError, pygame.error):
             return fallback or pygame.Surface((100, 150), pygame.SRCALPHA)
 
@@ -87,7 +101,10 @@ class Player(pygame.sprite.Sprite):
         ]
 
     def update(self, platforms=None):
-        """Movement, gravity, and disco-frame cycling."""
+        """Movement, gravity, and disco-frame cycling.
+
+        platforms is the level's platform SpatialHash.
+        """
         # Apply gravity
         self.velocity_y += GRAVITY
         self.rect.y     += self.velocity_y
@@ -107,7 +124,7 @@ class Player(pygame.sprite.Sprite):
     def _handle_platform_collision(self, platforms):
         """Stop vertical movement and reset jumping when landing."""
         self.rect.y += 1
-        hits = pygame.sprite.spritecollide(self, platforms, False)
+        hits = platforms.colliding(self.rect)
         self.rect.y -= 1
         if hits:
             self.rect.bottom = hits[0].rect.top
@@ -135,16 +152,47 @@ class Player(pygame.sprite.Sprite):
     def crouch(self, toggle):
         self.crouching = toggle
 
-    def draw(self, surface, camera):
-        """Draw the base sprite, then layer on each collected overlay."""
-        x = self.rect.x - camera.offset.x
-        y = self.rect.y - camera.offset.y
+    def composite(self):
+        """The current frame with its overlays flattened into one surface.
 
-        # Base character (always 100×150)
-        surface.blit(self.image, (x, y))
+        Returns (surface, offset, mask), offset being the surface's top-left
+        relative to rect.topleft (the hair reaches above the sprite). Built
+        the first time a frame, outfit and direction are seen, then reused.
+        """
+        key = (self.image, frozenset(self.outfit), self.direction)
+        entry = self.composites.get(key)
+        if entry is None:
+            entry = self.composites[key] = self._build_composite()
+        return entry
+
+    def _build_composite(self):
+        bounds = self.image.get_rect()
+        pieces = [self.overlays[piece] for piece in OUTFIT_ORDER if piece in self.outfit]
+        for overlay, (dx, dy) in pieces:
+            bounds.union_ip(overlay.get_rect(topleft=(dx, dy)))
+
+        # Base character (always 100×150), then overlays in outfit order.
+        # Layers are premultiplied where pygame supports it, so flattening
+        # them blends the same as blitting each one onto the screen.
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        layer_blit(surface, layer(self.image), (-bounds.x, -bounds.y))
+        for overlay, (dx, dy) in pieces:
+            layer_blit(surface, layer(overlay), (dx - bounds.x, dy - bounds.y))
+        if self.direction == "left":
+            surface = pygame.transform.flip(surface, True, False)
+        return surface, bounds.topleft, pygame.mask.from_surface(surface)
+
+    @property
+    def mask(self):
+        """Mask of the composited sprite; see composite() for its offset."""
+        return self.composite()[2]
+
+    def draw_rect(self):
+        """World-space area draw() covers: the sprite plus any overlays."""
+        surface, (dx, dy), _ = self.composite()
+        return surface.get_rect(topleft=(self.rect.x + dx, self.rect.y + dy))
 
-        # Overlays in outfit order
-        for piece in OUTFIT_ORDER:
-            if piece in self.outfit:
-                overlay, (dx, dy) = self.overlays[piece]
-                surface.blit(overlay, (x + dx, y + dy))
+    def draw(self, surface, camera):
+        """Draw the composited sprite in one blit."""
+        image, (dx, dy), _ = self.composite()
+        layer_blit(surface, image, (self.rect.x + dx - camera.offset.x, self.rect.y + dy - camera.offset.y))
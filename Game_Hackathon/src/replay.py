@@ -0,0 +1,237 @@
+# File: src/replay.py
+"""Record a game's per-tick inputs and replay them deterministically.
+
+A recording is the session seed plus one input bitmask per simulation tick,
+run-length encoded, so an hour of play is a few KB. Replaying feeds the
+same inputs through Game.step as fast as possible and checks the final
+state against the checksum stored at the end of the recording. Games played
+from main.py are recorded too when RETRO_RUNWAY_RECORD names a directory.
+
+    python replay.py record session.rrp [--seed N]
+    python replay.py play session.rrp [--draw] [--window] [--output replay.json]
+"""
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+
+import pygame
+from constants import FPS
+
+MAGIC   = b"RRPL"
+VERSION = 1
+HEADER  = struct.Struct("<4sBBQ")   # magic, version, flags, seed
+FLAG_PIXEL_COLLISION = 1
+
+# Bit i of a tick's mask is INPUT_KEYS[i]
+INPUT_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_DOWN,
+              pygame.K_UP, pygame.K_SPACE, pygame.K_LSHIFT, pygame.K_r)
+END_OF_INPUT = 0x80   # no input mask uses bit 7
+
+# Set RETRO_RUNWAY_RECORD to a directory to record every game played into it
+RECORD_DIR = os.environ.get('RETRO_RUNWAY_RECORD')
+
+def input_mask(inputs):
+    return sum(1 << i for i, key in enumerate(INPUT_KEYS) if key in inputs)
+
+def mask_inputs(mask):
+    return frozenset(key for i, key in enumerate(INPUT_KEYS) if mask >> i & 1)
+
+def write_varint(f, value):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        f.write(bytes((byte | 0x80 if value else byte,)))
+        if not value:
+            return
+
+def read_varint(f):
+    value = shift = 0
+    while True:
+        byte = f.read(1)
+        if not byte:
+            raise ValueError("truncated replay")
+        value |= (byte[0] & 0x7F) << shift
+        shift += 7
+        if not byte[0] & 0x80:
+            return value
+
+def state_checksum(game):
+    """64-bit digest of everything the simulation carries from tick to tick."""
+    player, enemies = game.player, game.level.enemies
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(repr((
+        game.ticks, game.current_level, game.game_state, game.score, game.collision_delay,
+        tuple(player.rect), player.velocity_y, player.jumping, player.crouching,
+        sorted(player.outfit), player.disco_active, player.disco_count, player.current_sprite,
+        [c.collected for c in game.level.collectibles],
+    )).encode())
+    for array in (enemies.x, enemies.y, enemies.direction, enemies.current,
+                  enemies.alerted, enemies.alert_timer):
+        digest.update(array.tobytes())
+    return int.from_bytes(digest.digest(), "little")
+
+class Recorder:
+    """Streams a session's inputs to path, one run of identical ticks at a time.
+
+    Call record() with each tick's inputs before passing them to Game.step,
+    and close() with the game afterwards to store the tick count and the
+    final state checksum.
+    """
+    def __init__(self, path, seed, pixel_collision=False):
+        self.file = open(path, "wb")
+        flags = FLAG_PIXEL_COLLISION if pixel_collision else 0
+        self.file.write(HEADER.pack(MAGIC, VERSION, flags, seed))
+        self.mask = None
+        self.run = 0
+        self.ticks = 0
+
+    def record(self, inputs):
+        mask = input_mask(inputs)
+        if mask != self.mask:
+            self._flush()
+            self.mask = mask
+        self.run += 1
+        self.ticks += 1
+
+    def _flush(self):
+        if self.run:
+            self.file.write(bytes((self.mask,)))
+            write_varint(self.file, self.run)
+        self.run = 0
+
+    def close(self, game):
+        if self.file.closed:
+            return
+        self._flush()
+        self.file.write(bytes((END_OF_INPUT,)))
+        write_varint(self.file, self.ticks)
+        self.file.write(struct.pack("<Q", state_checksum(game)))
+        self.file.close()
+
+class Recording:
+    """A recording read back: seed, flags, per-tick inputs and the expected end state."""
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            magic, version, self.flags, self.seed = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} replay")
+            self.runs = []   # (input keys, ticks)
+            while True:
+                mask = f.read(1)
+                if not mask:
+                    raise ValueError("truncated replay")
+                if mask[0] == END_OF_INPUT:
+                    break
+                self.runs.append((mask_inputs(mask[0]), read_varint(f)))
+            self.ticks = read_varint(f)
+            self.checksum, = struct.unpack("<Q", f.read(8))
+
+    @property
+    def pixel_collision(self):
+        return bool(self.flags & FLAG_PIXEL_COLLISION)
+
+    def inputs(self):
+        """Each tick's input keys, in order."""
+        for keys, count in self.runs:
+            for _ in range(count):
+                yield keys
+
+def session_recorder(game, directory=RECORD_DIR):
+    """A Recorder for a new game in directory, or None when recording is off."""
+    if not directory:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    name = f"session-{time.strftime('%Y%m%d-%H%M%S')}-{game.seed}.rrp"
+    return Recorder(os.path.join(directory, name), game.seed, game.collider is not None)
+
+def record_session(path, seed=None):
+    """Play the game in a window, recording every tick; ESC or closing the window stops.
+
+    Returns the game and the number of ticks recorded.
+    """
+    from game import Game, FixedTimestep, LiveInput
+    game = Game(seed=seed)
+    recorder = Recorder(path, game.seed, game.collider is not None)
+    live_input = LiveInput(recorder)
+    timestep = FixedTimestep()
+    running = True
+    try:
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    running = False
+                elif event.type == pygame.KEYDOWN:
+                    live_input.key_down(event.key)
+            for _ in range(timestep.advance()):
+                live_input.step(game)
+            game.draw(timestep.alpha)
+            game.sound_manager.update()
+            game.clock.tick(FPS)
+    finally:
+        # Even a crash leaves a complete recording of the ticks played
+        live_input.close(game)
+    return game, recorder.ticks
+
+def replay(recording, draw=False, headless=True):
+    """Run recording through a fresh Game as fast as it will go.
+
+    Returns (game, per-tick seconds); with draw, every tick is also rendered.
+    """
+    from game import Game
+    game = Game(headless=headless, seed=recording.seed, pixel_collision=recording.pixel_collision)
+    times = []
+    for inputs in recording.inputs():
+        start = time.perf_counter()
+        game.step(inputs)
+        if draw:
+            game.draw()
+        times.append(time.perf_counter() - start)
+    return game, times
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record", help="play and record a session")
+    record.add_argument("path")
+    record.add_argument("--seed", type=int)
+    play = commands.add_parser("play", help="replay a recorded session")
+    play.add_argument("path")
+    play.add_argument("--draw", action="store_true", help="render every tick")
+    play.add_argument("--window", action="store_true", help="render to a window instead of SDL's dummy driver")
+    play.add_argument("--output", help="write timings as JSON")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        game, ticks = record_session(args.path, args.seed)
+        print(f"Recorded {ticks} ticks with seed {game.seed} to {args.path}")
+        return 0
+
+    recording = Recording(args.path)
+    game, times = replay(recording, args.draw, headless=not args.window)
+    # Imported late: benchmark points SDL at the dummy drivers when imported
+    from benchmark import summarize
+    checksum = state_checksum(game)
+    result = {
+        "ticks": len(times),
+        "seconds": sum(times),
+        "checksum": f"{checksum:016x}",
+        "matches": checksum == recording.checksum and len(times) == recording.ticks,
+        "tick": summarize(times),
+    }
+    stats = result["tick"]
+    print(f"Replayed {result['ticks']} ticks in {result['seconds']:.3f} s "
+          f"({result['ticks'] / max(result['seconds'], 1e-9):.0f} ticks/s)")
+    print(f"  tick p50 {stats['p50']:7.3f} ms  p95 {stats['p95']:7.3f} ms  p99 {stats['p99']:7.3f} ms")
+    print(f"  final state {result['checksum']}: "
+          + ("matches the recording" if result["matches"] else f"expected {recording.checksum:016x}"))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+    return 0 if result["matches"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,52 +1,254 @@
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import pygame
 from constants import *
 
-class SoundManager:
-    def __init__(self):
-        self.sounds = {}
-        self.current_music = None
-        # Mapping track names to file paths
-        self.music_files = {
-            "menu_theme": os.path.join(MUSIC_PATH, "menu_theme.mp3"),
-            "level1_theme": os.path.join(MUSIC_PATH, "level1_theme.mp3"),
-            "level2_theme": os.path.join(MUSIC_PATH, "level2_theme.mp3"),
-            "victory_theme": os.path.join(MUSIC_PATH, "victory_theme.mp3"),
-        }
-        self.load_sounds()
-
-    def load_sounds(self):
-        # Load sound effects from EFFECTS_PATH
-        os.makedirs(EFFECTS_PATH, exist_ok=True)
+# Track names and their files
+MUSIC_FILES = {
+    "menu_theme": os.path.join(MUSIC_PATH, "menu_theme.mp3"),
+    "level1_theme": os.path.join(MUSIC_PATH, "level1_theme.mp3"),
+    "level2_theme": os.path.join(MUSIC_PATH, "level2_theme.mp3"),
+    "victory_theme": os.path.join(MUSIC_PATH, "victory_theme.mp3"),
+}
+
+def reserve_channels():
+    """Keep the effect and music channels away from Sound.play's automatic picks."""
+    total = EFFECT_CHANNELS + MUSIC_CHANNELS
+    if pygame.mixer.get_num_channels() < total:
+        pygame.mixer.set_num_channels(total)
+    pygame.mixer.set_reserved(total)
+
+class SoundBank:
+    """Sound effects shared by every SoundManager, decoded on first use.
+
+    Effects play on a fixed pool of reserved mixer channels. When the pool
+    is full, a new effect replaces the lowest-priority one still playing, or
+    is dropped if nothing playing ranks below it. Triggering the same
+    effect again within EFFECT_MIN_INTERVAL ms is ignored.
+    """
+    def __init__(self, path=EFFECTS_PATH, channels=EFFECT_CHANNELS):
+        self.path = path
+        self.channel_count = channels
+        self.files = None      # effect name -> file path, listed on first use
+        self.sounds = {}       # effect name -> decoded Sound
+        self.channels = None   # [(Channel, priority of what it is playing)]
+        self.last_played = {}  # effect name -> perf_counter() of the last play
+        self.lock = threading.Lock()
+        self.dropped = 0
+
+    def _list_files(self):
+        if self.files is None:
+            self.files = {}
+            try:
+                for sound_file in os.listdir(self.path):
+                    if sound_file.endswith(('.wav', '.mp3', '.ogg')):
+                        self.files[os.path.splitext(sound_file)[0]] = os.path.join(self.path, sound_file)
+            except OSError as e:
+                print(f"Sound loading error: {e}")
+        return self.files
+
+    def get(self, name):
+        """The decoded Sound for name, or None if there is no such effect."""
+        with self.lock:
+            if name not in self.sounds:
+                path = self._list_files().get(name)
+                try:
+                    self.sounds[name] = pygame.mixer.Sound(path) if path else None
+                except pygame.error as e:
+                    print(f"Sound loading error: {e}")
+                    self.sounds[name] = None
+            return self.sounds[name]
+
+    def preload(self, names=None):
+        """Decode effects (all of them by default) on a background thread."""
+        names = list(names) if names is not None else list(self._list_files())
+        thread = threading.Thread(target=self._decode, args=(names,), name="sound-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def _decode(self, names):
+        for name in names:
+            self.get(name)
+
+    def _channel_for(self, priority):
+        if self.channels is None:
+            reserve_channels()
+            self.channels = [[pygame.mixer.Channel(i), 0] for i in range(self.channel_count)]
+        idle = [entry for entry in self.channels if not entry[0].get_busy()]
+        if idle:
+            return idle[0]
+        lowest = min(self.channels, key=lambda entry: entry[1])
+        return lowest if lowest[1] < priority else None
+
+    def play(self, name):
+        now = time.perf_counter()
+        if (now - self.last_played.get(name, -1e9)) * 1000 < EFFECT_MIN_INTERVAL:
+            self.dropped += 1
+            return False
+        sound = self.get(name)
+        if sound is None:
+            return False
+        priority = EFFECT_PRIORITIES.get(name, 0)
+        entry = self._channel_for(priority)
+        if entry is None:
+            self.dropped += 1
+            return False
+        entry[0].play(sound)
+        entry[1] = priority
+        self.last_played[name] = now
+        return True
+
+sound_bank = SoundBank()
+
+class MusicPlayer:
+    """Background music, decoded off the main thread and crossfaded.
+
+    Tracks are decoded into Sounds on a worker thread and stay resident,
+    least recently used evicted first, within MUSIC_CACHE_BUDGET bytes.
+    play() never waits on the disk: a track that isn't decoded yet starts
+    from update() once the worker has it. Tracks alternate between two
+    reserved channels so the old one can fade out while the new one fades in.
+    """
+    def __init__(self, files=MUSIC_FILES, budget=MUSIC_CACHE_BUDGET):
+        self.files = files
+        self.budget = budget
+        self.tracks = OrderedDict()   # name -> decoded Sound, least recently used first
+        self.memory = 0
+        self.pending = {}             # name -> Future of a decode in progress
+        self.failed = set()
+        self.lock = threading.Lock()
+        self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="music-decode")
+        self.channels = None
+        self.active = 0               # index into channels of the current track
+        self.current = None
+        self.queued = None            # (name, fade_ms) waiting for its decode
+
+    def prefetch(self, name):
+        """Start decoding name in the background if it isn't resident yet."""
+        with self.lock:
+            if name in self.tracks or name in self.pending or name in self.failed or name not in self.files:
+                return
+            self.pending[name] = self.pool.submit(self._decode, name)
+
+    def _decode(self, name):
         try:
-            for sound_file in os.listdir(EFFECTS_PATH):
-                if sound_file.endswith(('.wav', '.mp3', '.ogg')):
-                    name = os.path.splitext(sound_file)[0]
-                    full_path = os.path.join(EFFECTS_PATH, sound_file)
-                    if os.path.exists(full_path):
-                        self.sounds[name] = pygame.mixer.Sound(full_path)
-        except Exception as e:
-            print(f"Sound loading error: {e}")
+            sound = pygame.mixer.Sound(self.files[name])
+        except (pygame.error, OSError) as e:
+            # Missing or corrupt tracks just leave the current music playing
+            print(f"Warning: Could not load music '{name}': {e}")
+            sound = None
+        with self.lock:
+            del self.pending[name]
+            if sound is None:
+                self.failed.add(name)
+            else:
+                self._store(name, sound)
+
+    def _store(self, name, sound):
+        self.tracks[name] = sound
+        self.memory += sound_bytes(sound)
+        # Never drop the new track, the one playing or the one waiting to
+        # start (it would never be requested again); evict the rest oldest first
+        queued = self.queued
+        keep = {name, self.current, queued[0] if queued else None}
+        for oldest in [n for n in self.tracks if n not in keep]:
+            if self.memory <= self.budget:
+                break
+            self.memory -= sound_bytes(self.tracks.pop(oldest))
+
+    def play(self, name, fade_ms=MUSIC_CROSSFADE_MS):
+        """Crossfade to name, as soon as it is decoded."""
+        if name == self.current and self.queued is None:
+            return
+        self.queued = (name, fade_ms)
+        self.prefetch(name)
+        self.update()
+
+    def update(self):
+        """Start a queued track once its decode is done; call once per frame."""
+        if self.queued is None:
+            return
+        name, fade_ms = self.queued
+        with self.lock:
+            if name in self.failed:
+                self.queued = None
+                return
+            sound = self.tracks.get(name)
+            if sound is None:
+                return
+            self.tracks.move_to_end(name)
+        self.queued = None
+        self._crossfade(name, sound, fade_ms)
+
+    def _crossfade(self, name, sound, fade_ms):
+        if self.channels is None:
+            reserve_channels()
+            self.channels = [pygame.mixer.Channel(EFFECT_CHANNELS + i) for i in range(MUSIC_CHANNELS)]
+        old, new = self.channels[self.active], self.channels[1 - self.active]
+        if fade_ms:
+            old.fadeout(fade_ms)
+        else:
+            old.stop()
+        new.play(sound, loops=-1, fade_ms=fade_ms)
+        self.active = 1 - self.active
+        self.current = name
+
+    def fadeout(self, duration):
+        self.queued = None
+        self.current = None
+        for channel in self.channels or ():
+            channel.fadeout(duration)
+
+    def stop(self):
+        self.queued = None
+        self.current = None
+        for channel in self.channels or ():
+            channel.stop()
+
+def sound_bytes(sound):
+    frequency, size, channels = pygame.mixer.get_init()
+    return round(sound.get_length() * frequency) * channels * abs(size) // 8
+
+music_player = MusicPlayer()
+
+class SoundManager:
+    def __init__(self, enabled=True, bank=sound_bank, music=music_player):
+        # A disabled manager (headless runs) loads nothing and plays nothing
+        self.enabled = enabled
+        self.bank = bank
+        self.music = music
+        self.music_files = music.files
 
     def play_sound(self, name):
-        # Play a sound effect if loaded
-        if name in self.sounds:
-            self.sounds[name].play()
+        # Effects come from the shared bank, decoded the first time they play
+        if self.enabled:
+            self.bank.play(name)
 
-    def play_music(self, track_name):
-        # Safely load and play background music, catching corrupt file errors
-        if track_name in self.music_files:
-            try:
-                path = self.music_files[track_name]
-                pygame.mixer.music.load(path)
-                pygame.mixer.music.play(-1)  # Loop indefinitely
-                self.current_music = track_name
-            except pygame.error as e:
-                # Handle corrupt or unreadable music files gracefully
-                print(f"Warning: Could not load music '{track_name}': {e}")
+    def prefetch_music(self, track_name):
+        # Decode a track ahead of time so switching to it is instant;
+        # safe to call from a worker thread
+        if self.enabled:
+            self.music.prefetch(track_name)
+
+    def play_music(self, track_name, fade_ms=MUSIC_CROSSFADE_MS):
+        # Crossfade to the track once it has been decoded in the background;
+        # missing or corrupt files print a warning and keep the current music
+        if self.enabled and track_name in self.music_files:
+            self.music.play(track_name, fade_ms)
+
+    def update(self):
+        # Starts music that finished decoding since the last frame
+        if self.enabled:
+            self.music.update()
 
     def stop_music(self):
-        pygame.mixer.music.stop()
+        if self.enabled:
+            self.music.stop()
 
     def fadeout_music(self, duration=1000):
-        pygame.mixer.music.fadeout(duration)
+        if self.enabled:
+            self.music.fadeout(duration)
@@ -0,0 +1,66 @@
+# File: src/spatial.py
+from collections import defaultdict
+
+from constants import SPATIAL_CELL_SIZE
+
+class SpatialHash:
+    """Uniform grid mapping world cells to the sprites whose rect overlaps them.
+
+    Queries only look at the cells a rect covers, so their cost follows local
+    density instead of level size. Results come back in insertion order, the
+    same order a sprite Group would iterate them in.
+    """
+    def __init__(self, items=(), cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        self.entries = {}   # id(item) -> (sequence, item, cells)
+        self.sequence = 0
+        for item in items:
+            self.insert(item)
+
+    def _cells(self, rect):
+        size = self.cell_size
+        left, top = rect.left // size, rect.top // size
+        right = max(left, (rect.right - 1) // size)
+        bottom = max(top, (rect.bottom - 1) // size)
+        return [(cx, cy) for cx in range(left, right + 1) for cy in range(top, bottom + 1)]
+
+    def insert(self, item):
+        cells = self._cells(item.rect)
+        self.entries[id(item)] = (self.sequence, item, cells)
+        self.sequence += 1
+        for cell in cells:
+            self.cells[cell].append(item)
+
+    def remove(self, item):
+        _, _, cells = self.entries.pop(id(item))
+        for cell in cells:
+            bucket = self.cells[cell]
+            bucket.remove(item)
+            if not bucket:
+                del self.cells[cell]
+
+    def move(self, item):
+        """Re-index item after its rect changed."""
+        self.remove(item)
+        self.insert(item)
+
+    def query(self, rect):
+        """Items sharing a cell with rect (a superset of the colliding ones)."""
+        found = {}
+        for cell in self._cells(rect):
+            for item in self.cells.get(cell, ()):
+                found[id(item)] = item
+        if len(found) > 1:
+            return sorted(found.values(), key=lambda item: self.entries[id(item)][0])
+        return list(found.values())
+
+    def colliding(self, rect):
+        """Items whose rect overlaps rect, in insertion order."""
+        return [item for item in self.query(rect) if item.rect.colliderect(rect)]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return (item for _, item, _ in sorted(self.entries.values(), key=lambda e: e[0]))
@@ -0,0 +1,42 @@
+# File: src/startup_trace.py
+import os
+import sys
+import time
+
+# Set RETRO_RUNWAY_STARTUP_TRACE=1 or pass --trace-startup to print where startup time goes
+ENABLED = os.environ.get('RETRO_RUNWAY_STARTUP_TRACE') == '1' or '--trace-startup' in sys.argv
+
+class StartupTrace:
+    """Splits the time up to the first frame into named phases.
+
+    Startup is sequential, so each mark() charges the time since the
+    previous mark to the phase it names; the same name may be marked more
+    than once. frame_shown() closes the trace after the first flip and
+    prints the report when tracing is enabled.
+    """
+    def __init__(self, start=None, enabled=ENABLED):
+        self.start = start if start is not None else time.perf_counter()
+        self.enabled = enabled
+        self.last = self.start
+        self.phases = {}          # name -> seconds, in first-marked order
+        self.first_frame = None   # seconds from start to the first flip
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases[name] = self.phases.get(name, 0.0) + now - self.last
+        self.last = now
+
+    def frame_shown(self):
+        """Call after every flip; only the first one is recorded."""
+        if self.first_frame is not None:
+            return
+        self.mark("frame")
+        self.first_frame = self.last - self.start
+        if self.enabled:
+            print(self.report())
+
+    def report(self):
+        lines = [f"Startup: first frame after {self.first_frame * 1000:.1f} ms"]
+        for name, seconds in self.phases.items():
+            lines.append(f"  {name:<8} {seconds * 1000:7.1f} ms")
+        return "\n".join(lines)
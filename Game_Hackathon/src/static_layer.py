@@ -0,0 +1,47 @@
+# File: src/static_layer.py
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+class StaticLayer:
+    """A tile map and sprites that never move, pre-composited into screen-wide chunks.
+
+    Chunks only span the band of rows the sprites actually occupy, so a long
+    level costs a strip of pixels per screen rather than a full screen each.
+    Drawing the layer is one blit per chunk the view overlaps (at most two).
+    """
+    def __init__(self, width, sprites, tilemap=None, chunk_width=SCREEN_WIDTH):
+        self.chunk_width = chunk_width
+        self.chunks = []   # (world rect, surface)
+        sprites = list(sprites)
+        rects = [s.rect for s in sprites] + ([tilemap.bounds()] if tilemap else [])
+        if not rects:
+            return
+
+        band = rects[0].unionall(rects[1:])
+        band = band.clip(pygame.Rect(0, 0, width, SCREEN_HEIGHT))
+        for x in range(0, width, chunk_width):
+            chunk = pygame.Rect(x, band.top, min(chunk_width, width - x), band.height)
+            surface = pygame.Surface(chunk.size, pygame.SRCALPHA)
+            if tilemap:
+                tilemap.draw(surface, chunk, chunk.topleft)
+            # Sprites are composited in the order given, same as drawing them
+            for sprite in sprites:
+                if sprite.rect.colliderect(chunk):
+                    surface.blit(sprite.image, (sprite.rect.x - chunk.x, sprite.rect.y - chunk.y))
+            self.chunks.append((chunk, surface))
+
+    def draw(self, screen, view, offset):
+        """Blit the part of the layer inside view (world space); returns chunks drawn."""
+        first = max(0, int(view.left) // self.chunk_width)
+        last = min(len(self.chunks) - 1, (int(view.right) - 1) // self.chunk_width)
+        drawn = 0
+        for chunk, surface in self.chunks[first:last + 1]:
+            visible = chunk.clip(view)
+            if visible:
+                area = visible.move(-chunk.x, -chunk.y)
+                screen.blit(surface, (visible.x - offset.x, visible.y - offset.y), area)
+                drawn += 1
+        return drawn
+
+    def __len__(self):
+        return len(self.chunks)
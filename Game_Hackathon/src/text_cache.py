@@ -0,0 +1,48 @@
+# File: src/text_cache.py
+from collections import OrderedDict
+
+from constants import TEXT_CACHE_SIZE
+
+class TextCache:
+    """LRU cache of rendered text surfaces.
+
+    Keyed by (font, text, color, antialias), so a string is only rasterized
+    again once it actually changes. Returned surfaces are shared; don't draw
+    onto them.
+    """
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color):
+        """Drop-in for font.render(text, antialias, color)."""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def stats(self):
+        return {
+            "entries":   len(self.surfaces),
+            "hits":      self.hits,
+            "misses":    self.misses,
+            "evictions": self.evictions,
+        }
+
+text_cache = TextCache()
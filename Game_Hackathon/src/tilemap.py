@@ -0,0 +1,163 @@
+# File: src/tilemap.py
+import math
+import os
+import re
+from array import array
+
+import pygame
+from constants import SCREEN_HEIGHT, TILE_SIZE, LEVELS_PATH
+
+# Tile ids stored in the map, and the characters that spell them in level files
+TILE_EMPTY = 0
+TILE_FLOOR = 1
+TILE_CHARS = {'.': TILE_EMPTY, '#': TILE_FLOOR}
+SOLID_TILES = {TILE_FLOOR}
+
+FLOOR_HEIGHT = 50   # the default floor strip along the bottom of the screen
+
+class Collider:
+    """A merged run of solid tiles; has a rect like the sprites it replaces."""
+    __slots__ = ("rect",)
+
+    def __init__(self, rect):
+        self.rect = rect
+
+class TileMap:
+    """Grid of tile ids, stored row-major as one byte per tile.
+
+    origin is the world position of the top-left tile, so maps can cover
+    just the band of the level that has tiles in it.
+    """
+    def __init__(self, cols, rows, tile_size=(TILE_SIZE, TILE_SIZE), origin=(0, 0), tiles=None):
+        self.cols, self.rows = cols, rows
+        self.tile_width, self.tile_height = tile_size
+        self.origin = origin
+        self.tiles = tiles if tiles is not None else array('B', bytes(cols * rows))
+        if len(self.tiles) != cols * rows:
+            raise ValueError(f"tile map needs {cols * rows} tiles, got {len(self.tiles)}")
+
+    @property
+    def width(self):
+        return self.cols * self.tile_width
+
+    def __getitem__(self, pos):
+        col, row = pos
+        return self.tiles[row * self.cols + col]
+
+    def __setitem__(self, pos, tile):
+        col, row = pos
+        self.tiles[row * self.cols + col] = tile
+
+    def tile_rect(self, col, row, cols=1, rows=1):
+        return pygame.Rect(
+            self.origin[0] + col * self.tile_width, self.origin[1] + row * self.tile_height,
+            cols * self.tile_width, rows * self.tile_height
+        )
+
+    def bounds(self):
+        return self.tile_rect(0, 0, self.cols, self.rows)
+
+    @classmethod
+    def floor(cls, width):
+        """A single row of floor tiles along the bottom of a level width px wide."""
+        cols = math.ceil(width / TILE_SIZE)
+        return cls(cols, 1, (TILE_SIZE, FLOOR_HEIGHT), (0, SCREEN_HEIGHT - FLOOR_HEIGHT),
+                   array('B', [TILE_FLOOR]) * cols)
+
+    @classmethod
+    def load(cls, filename):
+        with open(os.path.join(LEVELS_PATH, filename)) as f:
+            return cls.parse(f.read())
+
+    @classmethod
+    def parse(cls, text):
+        """Parse a level file.
+
+        Header lines are "key value..." pairs (tile <w> <h>, origin <x> <y>),
+        then a "---" line, then one run-length encoded row per line: "25#" is
+        25 floor tiles and "3.22#" is three empty tiles then 22 floor tiles.
+        Lines starting with ";" are comments.
+        """
+        header, rows = {}, []
+        lines = (line.strip() for line in text.splitlines())
+        for line in lines:
+            if line == '---':
+                break
+            if line and not line.startswith(';'):
+                key, *values = line.split()
+                header[key] = tuple(int(v) for v in values)
+        for line in lines:
+            if line and not line.startswith(';'):
+                row = array('B')
+                for count, char in re.findall(r'(\d*)(\D)', line):
+                    row.extend([TILE_CHARS[char]] * int(count or 1))
+                rows.append(row)
+
+        cols = max((len(row) for row in rows), default=0)
+        tiles = array('B')
+        for row in rows:
+            tiles.extend(row)
+            tiles.extend([TILE_EMPTY] * (cols - len(row)))
+        return cls(cols, len(rows), header.get('tile', (TILE_SIZE, TILE_SIZE)),
+                   header.get('origin', (0, 0)), tiles)
+
+    def colliders(self):
+        """Merge solid tiles into as few rects as possible.
+
+        Each row is split into horizontal runs of solid tiles; a run that
+        spans exactly the same columns as one in the row above extends it
+        downwards instead of starting a new rect.
+        """
+        done, open_runs = [], {}   # (first col, last col) -> [top row, rows]
+        for row in range(self.rows):
+            runs, col = set(), 0
+            while col < self.cols:
+                if self[col, row] in SOLID_TILES:
+                    start = col
+                    while col < self.cols and self[col, row] in SOLID_TILES:
+                        col += 1
+                    runs.add((start, col))
+                else:
+                    col += 1
+            for run in list(open_runs):
+                if run not in runs:
+                    done.append((run, *open_runs.pop(run)))
+            for run in runs:
+                if run in open_runs:
+                    open_runs[run][1] += 1
+                else:
+                    open_runs[run] = [row, 1]
+        done.extend((run, *span) for run, span in open_runs.items())
+        done.sort(key=lambda entry: (entry[1], entry[0]))
+        return [
+            Collider(self.tile_rect(start, top, end - start, rows))
+            for (start, end), top, rows in done
+        ]
+
+    def draw(self, surface, area, offset=(0, 0)):
+        """Draw the tiles overlapping area (world space) onto surface at -offset."""
+        area = area.clip(self.bounds())
+        if not area:
+            return
+        first_col = (area.left - self.origin[0]) // self.tile_width
+        last_col = (area.right - 1 - self.origin[0]) // self.tile_width
+        first_row = (area.top - self.origin[1]) // self.tile_height
+        last_row = (area.bottom - 1 - self.origin[1]) // self.tile_height
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                tile = self[col, row]
+                if tile != TILE_EMPTY:
+                    rect = self.tile_rect(col, row)
+                    surface.blit(tile_image(tile, rect.size), (rect.x - offset[0], rect.y - offset[1]))
+
+# One shared surface per (tile id, size)
+_tile_images = {}
+
+def tile_image(tile, size):
+    key = (tile, size)
+    if key not in _tile_images:
+        image = pygame.Surface(size)
+        image.fill((50,50,50))
+        pygame.draw.rect(image, (100,100,100), (0,0,*size), 3)
+        _tile_images[key] = image
+    return _tile_images[key]
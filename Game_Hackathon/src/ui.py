@@ -1,5 +1,6 @@
 import pygame
 from constants import *
+from text_cache import text_cache
 
 class UI:
     def __init__(self):
@@ -18,7 +19,7 @@ class UI:
         # Options
         for i, option in enumerate(self.options):
             color = RETRO_YELLOW if i == self.selected else DISCO_BLUE
-            text = self.font_small.render(option, True, color)
+            text = text_cache.render(self.font_small, option, True, color)
             screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, 300 + i * 50))
 
     def handle_input(self, event):
@@ -0,0 +1,56 @@
+# File: src/vision.py
+import numpy as np
+from bouncer import cone_sprite
+from collision import image_mask
+from constants import VISION_CONE_LENGTH, VISION_CONE_ANGLE
+
+def player_hidden(player):
+    """True when no cone can see the player this tick.
+
+    Crouching keeps the player out of sight on its own, whether or not a
+    hiding spot is in the way, and the disco ball blinds every bouncer.
+    """
+    return player.disco_active or player.crouching
+
+def cone_hits(x, y, direction, px, py):
+    """Boolean array: which cones (apex x, y and facing +-1, as arrays) contain px, py."""
+    dx = px - x
+    dy = py - y
+    in_range = dx * dx + dy * dy < VISION_CONE_LENGTH * VISION_CONE_LENGTH
+    angle = np.degrees(np.arctan2(-dy, dx)) % 360
+    angle_diff = np.abs((direction * 180 - angle + 180) % 360 - 180)
+    return in_range & (angle_diff < VISION_CONE_ANGLE / 2)
+
+def cone_mask_hits(enemies, player, collider, hits):
+    """Which cones overlap the player's pixels.
+
+    Only cones whose bounding box touches the player's get a mask test;
+    hits (the centre-point result) answers for any past the collider's budget.
+    """
+    body = player.draw_rect()
+    cones, _ = enemies.visible(body)
+    pixel_hits = np.zeros(len(enemies), dtype=bool)
+    x, y = enemies.centers()
+    for i in np.flatnonzero(cones):
+        cone, (apex_x, apex_y) = cone_sprite(int(enemies.direction[i]))
+        rect = cone.get_rect(topleft=(int(x[i]) - apex_x, int(y[i]) - apex_y))
+        # The cone is drawn translucent, so every pixel it paints counts
+        pixel_hits[i] = collider.overlap(rect, image_mask(cone, 0), body, player.mask, bool(hits[i]))
+    return pixel_hits
+
+def spot_player(enemies, player, collider=None):
+    """Alert every bouncer that can see the player and return them, in order.
+
+    enemies is a BouncerManager; cones are tested straight from its arrays.
+    With a MaskCollider, a cone must cover one of the player's pixels rather
+    than the centre of their rect.
+    """
+    if player_hidden(player) or not len(enemies):
+        return []
+    x, y = enemies.centers()
+    hits = cone_hits(x, y, enemies.direction, player.rect.centerx, player.rect.centery)
+    if collider is not None:
+        hits = cone_mask_hits(enemies, player, collider, hits)
+    spotted = np.flatnonzero(hits)
+    enemies.alert(spotted)
+    return [enemies[i] for i in spotted]
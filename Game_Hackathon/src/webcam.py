@@ -0,0 +1,171 @@
+# File: src/webcam.py
+import glob
+import os
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+import pygame
+
+BUFFER_SIZE = 4        # most recent frames kept, with their capture times
+STOP_TIMEOUT = 1.0     # seconds to wait for the worker to notice a stop
+
+class CaptureWorker:
+    """Owns a capture source and reads it on a background thread.
+
+    source_factory is called on the worker thread and must return something
+    shaped like cv2.VideoCapture (isOpened, read, release). Frames land in a
+    small ring buffer of (timestamp, frame), so the UI never waits on the
+    camera and a snapshot is just the newest entry.
+    """
+    def __init__(self, source_factory, buffer_size=BUFFER_SIZE):
+        self.source_factory = source_factory
+        self.frames = deque(maxlen=buffer_size)
+        self.lock = threading.Lock()
+        self.running = threading.Event()
+        self.opened = False
+        self.thread = None
+
+    def start(self, timeout=STOP_TIMEOUT):
+        """Start capturing; returns False if a stopping worker still holds the source.
+
+        A worker that is shutting down gets up to timeout seconds to release
+        the source first, so two threads never open the device at once.
+        """
+        if self.thread and self.thread.is_alive():
+            if self.running.is_set():
+                return True
+            self.stop(timeout)
+            if self.thread:
+                return False
+        self.frames.clear()
+        self.opened = False
+        self.running.set()
+        self.thread = threading.Thread(target=self._run, name="webcam-capture", daemon=True)
+        self.thread.start()
+        return True
+
+    def stop(self, timeout=STOP_TIMEOUT):
+        """Ask the worker to release the source; waits up to timeout seconds.
+
+        The thread is only forgotten once it has exited.
+        """
+        self.running.clear()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout)
+        if self.thread and not self.thread.is_alive():
+            self.thread = None
+
+    def _run(self):
+        source = self.source_factory()
+        try:
+            self.opened = source.isOpened()
+            while self.opened and self.running.is_set():
+                ret, frame = source.read()
+                if not ret:
+                    time.sleep(0.005)
+                    continue
+                with self.lock:
+                    self.frames.append((time.perf_counter(), frame))
+        finally:
+            self.opened = False
+            source.release()
+
+    def is_opened(self):
+        return self.opened
+
+    def latest(self):
+        """The newest (timestamp, frame), or None before the first frame."""
+        with self.lock:
+            return self.frames[-1] if self.frames else None
+
+class ReplaySource:
+    """Stand-in for cv2.VideoCapture that plays image files from a directory.
+
+    Frames are returned in filename order at roughly fps, looping forever,
+    so the menu and CaptureWorker can be exercised without a camera.
+    """
+    EXTENSIONS = ('*.png', '*.jpg', '*.jpeg', '*.bmp')
+
+    def __init__(self, directory, fps=30):
+        paths = sorted(p for ext in self.EXTENSIONS for p in glob.glob(os.path.join(directory, ext)))
+        self.frames = [frame for frame in map(cv2.imread, paths) if frame is not None]
+        self.interval = 1 / fps
+        self.index = 0
+        self.next_time = time.perf_counter()
+
+    def isOpened(self):
+        return bool(self.frames)
+
+    def read(self):
+        if not self.frames:
+            return False, None
+        # Pace reads like a real camera would
+        delay = self.next_time - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        self.next_time = max(self.next_time, time.perf_counter() - self.interval) + self.interval
+        frame = self.frames[self.index].copy()
+        self.index = (self.index + 1) % len(self.frames)
+        return True, frame
+
+    def release(self):
+        self.frames = []
+
+class CameraPreview:
+    """Turns camera frames into the circular preview without per-frame allocations.
+
+    Frames are resized, mirrored and converted to RGB by OpenCV into one
+    preallocated buffer that a pygame surface wraps directly, so there is no
+    rotate-and-copy and no new surface per frame. The converted still is
+    kept until a different image is captured.
+    """
+    SIZE = (400, 300)
+
+    def __init__(self):
+        w, h = self.SIZE
+        self.resized = np.empty((h, w, 3), np.uint8)
+        self.mirrored = np.empty((h, w, 3), np.uint8)
+        self.rgb = np.empty((h, w, 3), np.uint8)
+        # Shares memory with self.rgb, so converting a frame updates it in place
+        self.frame = pygame.image.frombuffer(self.rgb, self.SIZE, 'RGB')
+        self.frame.set_colorkey((0, 0, 0))
+        self.mask = pygame.Surface(self.SIZE, pygame.SRCALPHA)
+        self.mask.fill((0, 0, 0, 0))
+        pygame.draw.circle(self.mask, (255, 255, 255, 255), (w // 2, h // 2), h // 2)
+        self.surface = pygame.Surface(self.SIZE, pygame.SRCALPHA)
+        self.still = None
+        self.still_source = None
+
+    def _convert(self, frame):
+        cv2.resize(frame, self.SIZE, dst=self.resized, interpolation=cv2.INTER_LINEAR)
+        cv2.flip(self.resized, 1, dst=self.mirrored)
+        cv2.cvtColor(self.mirrored, cv2.COLOR_BGR2RGB, dst=self.rgb)
+
+    def _compose(self):
+        self.surface.fill((0, 0, 0, 0))
+        self.surface.blit(self.frame, (0, 0))
+        self.surface.blit(self.mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        return self.surface
+
+    def live(self, frame):
+        """Circular preview of a BGR camera frame; only valid until the next call."""
+        self._convert(frame)
+        return self._compose()
+
+    def captured(self, image):
+        """Circular preview of a captured BGR still, converted once."""
+        if image is not self.still_source:
+            self._convert(image)
+            self.still = self._compose().copy()
+            self.still_source = image
+        return self.still
+
+def camera_source(device=0):
+    """Source factory for the menu: a replay directory if one is configured, else the webcam."""
+    replay = os.environ.get('RETRO_RUNWAY_CAMERA_REPLAY')
+    if replay:
+        return ReplaySource(replay)
+    return cv2.VideoCapture(device)
@@ -1,28 +1,31 @@
+import time
+_started = time.perf_counter()  # startup trace origin, before any heavy import
+
 import pygame
 import sys
-import cv2
 import numpy as np
 import os  # Add this import
 import atexit
-import time
+import threading
 
-# Initialize Pygame
-pygame.init()
-pygame.font.init()
+# Shared helpers live with the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Game_Hackathon', 'src'))
+from text_cache import text_cache
+from startup_trace import StartupTrace
 
-# Load your uploaded background
-background = pygame.image.load('./assets/backgrounds/mainbackground.png')
-background = pygame.transform.scale(background, (800, 600))
+# OpenCV and the camera subsystem (webcam.py) are imported on first use
+trace = StartupTrace(_started)
+trace.mark("import")
 
-# Screen setup
-screen = pygame.display.set_mode((800, 600))
-pygame.display.set_caption("Retro Runway - Main Menu")
+BACKGROUND_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               'Game_Hackathon', 'src', 'assets', 'Images', 'mainbackground.png')
 
-
-# Fonts
-font = pygame.font.SysFont('Arial', 32)
-small_font = pygame.font.SysFont('Arial', 24)
-button_font = pygame.font.SysFont('Arial', 20)
+# Window, background and fonts are set up by init()
+screen = None
+background = None
+font = None
+small_font = None
+button_font = None
 
 # Colors
 WHITE = (255, 255, 255)
@@ -33,10 +36,16 @@ MODAL_COLOR = (0, 0, 0, 200)  # Semi-transparent black
 CIRCLE_COLOR = (40, 40, 40)
 PURPLE = (142, 45, 226)  # #8e2de2
 BLUE = (74, 0, 224)      # #4a00e0
+HOVER_PURPLE = (166, 85, 240)
+HOVER_BLUE = (104, 40, 240)
 PURPLE_MODAL = (142, 45, 226, 240)  # Rich purple, slightly transparent
 DARK_PURPLE_TOP = (75, 0, 110)
 DARK_PURPLE_BOTTOM = (26, 0, 51)
 
+# Repaint only what changed instead of flipping every frame (low-power displays)
+DIRTY_RECTS = os.environ.get('RETRO_RUNWAY_DIRTY_RECTS') == '1'
+CAMERA_REGION = pygame.Rect(200, 140, 400, 380)  # preview circle, border and its buttons
+
 # Variables
 show_instructions = False
 image_captured = False
@@ -45,10 +54,11 @@ show_camera = False
 camera_buttons = []
 close_button = None  # Initialize close_button variable
 show_live_feed = True  # Add this with other global variables
+camera = None  # CaptureWorker, created the first time the camera is opened
 
 # Button Class
 class Button:
-    def __init__(self, text, x, y, w, h, callback, font=button_font):
+    def __init__(self, text, x, y, w, h, callback, font=None):
         self.text = text
         self.rect = pygame.Rect(x, y, w, h)
         self.callback = callback
@@ -60,10 +70,13 @@ class Button:
         if color_override is not None:
             pygame.draw.rect(surface, color_override, self.rect, border_radius=10)
         elif gradient:
-            draw_gradient_rect(surface, self.rect, PURPLE, BLUE)
+            if self.rect.collidepoint(mouse_pos):
+                draw_gradient_rect(surface, self.rect, HOVER_PURPLE, HOVER_BLUE)
+            else:
+                draw_gradient_rect(surface, self.rect, PURPLE, BLUE)
         else:
             pygame.draw.rect(surface, color, self.rect, border_radius=10)
-        text_surface = self.font.render(self.text, True, WHITE)
+        text_surface = text_cache.render(self.font or button_font, self.text, True, WHITE)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
 
@@ -91,6 +104,8 @@ def quit_game():
             print('captured_image.png not found in quit_game.')
     except Exception as e:
         print(f"Error deleting captured_image.png in quit_game: {e}")
+    if camera:
+        camera.stop()
     pygame.quit()
     sys.exit()
 
@@ -104,17 +119,16 @@ def create_camera_buttons():
 
 def take_snapshot():
     global captured_image, image_captured, camera_buttons, show_live_feed
-    if cap.isOpened():
-        ret, frame = cap.read()
-        if ret:
-            captured_image = frame
-            image_captured = True  # Mark that an image has been captured
-            show_live_feed = False  # Don't show live feed after capture
-            # After Click: Recapture and Done
-            camera_buttons = [
-                Button('Recapture', 200, 500, 120, 40, recapture_image),
-                Button('Done', 340, 500, 120, 40, finish_capture)
-            ]
+    latest = camera.latest()  # the newest frame, no waiting on the camera
+    if latest is not None:
+        _, captured_image = latest
+        image_captured = True  # Mark that an image has been captured
+        show_live_feed = False  # Don't show live feed after capture
+        # After Click: Recapture and Done
+        camera_buttons = [
+            Button('Recapture', 200, 500, 120, 40, recapture_image),
+            Button('Done', 340, 500, 120, 40, finish_capture)
+        ]
 
 def recapture_image():
     global image_captured, camera_buttons, show_live_feed
@@ -128,40 +142,91 @@ def recapture_image():
 def finish_capture():
     global show_camera, image_captured
     if image_captured and captured_image is not None:
+        import cv2
         cv2.imwrite('captured_image.png', captured_image)
     show_camera = False
-    cap.release()
+    camera.stop()
 
 def continue_without_capture():
     global show_camera, image_captured
     image_captured = False
     show_camera = False
-    cap.release()
+    if camera:
+        camera.stop()
 
 def capture_image():
-    global show_camera, cap
-    show_camera = True
-    cap = cv2.VideoCapture(0)
-    create_camera_buttons()
+    global show_camera, camera
+    if camera is None:
+        from webcam import CaptureWorker, camera_source
+        camera = CaptureWorker(camera_source)
+    # A worker still releasing the device refuses to start; the menu stays
+    # as it is and the capture button can simply be pressed again
+    show_camera = camera.start()
+    if show_camera:
+        create_camera_buttons()
+
+def gradient_steps(steps, color1, color2):
+    """(steps, 3) array of colors blending from color1 to color2."""
+    ratio = np.arange(steps)[:, None] / steps
+    blend = np.array(color1[:3]) * (1 - ratio) + np.array(color2[:3]) * ratio
+    return blend.astype(np.uint8)
+
+# Gradients are built once per (shape, size, colors) and reused every frame
+_gradients = {}
+
+def gradient_surface(size, color1, color2, alpha=None):
+    """Vertical gradient from color1 (top) to color2 (bottom); per-pixel alpha if given."""
+    key = ('rect', tuple(size), tuple(color1), tuple(color2), alpha)
+    if key not in _gradients:
+        surface = pygame.Surface(size, pygame.SRCALPHA if alpha is not None else 0)
+        pygame.surfarray.pixels3d(surface)[:] = gradient_steps(size[1], color1, color2)[None]
+        if alpha is not None:
+            pygame.surfarray.pixels_alpha(surface)[:] = alpha
+        _gradients[key] = surface
+    return _gradients[key]
+
+def gradient_ring(radius, color1, color2, width):
+    """Ring width px thick blending from color1 (outer edge) to color2 (inner edge)."""
+    key = ('ring', radius, tuple(color1), tuple(color2), width)
+    if key not in _gradients:
+        size = radius * 2 + 1
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        offsets = np.arange(size) - radius
+        # Step i covers the pixels that round to a distance of radius - i
+        step = np.floor(radius + 0.5 - np.hypot(offsets[:, None], offsets[None, :])).astype(int)
+        inside = (step >= 0) & (step < width)
+        pygame.surfarray.pixels3d(surface)[inside] = gradient_steps(width, color1, color2)[step[inside]]
+        pygame.surfarray.pixels_alpha(surface)[:] = np.where(inside, 255, 0)
+        _gradients[key] = surface
+    return _gradients[key]
 
 def draw_gradient_rect(surface, rect, color1, color2):
     """Draw a vertical gradient from color1 (top) to color2 (bottom) in the given rect."""
-    x, y, w, h = rect
-    for i in range(h):
-        ratio = i / h
-        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-        pygame.draw.line(surface, (r, g, b), (x, y + i), (x + w, y + i))
+    rect = pygame.Rect(rect)
+    surface.blit(gradient_surface(rect.size, color1, color2), rect)
 
 def draw_gradient_circle(surface, center, radius, color1, color2, width=10):
     """Draw a circular gradient border from color1 to color2."""
-    for i in range(width):
-        ratio = i / width
-        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-        pygame.draw.circle(surface, (r, g, b), center, radius - i, 1)
+    surface.blit(gradient_ring(radius, color1, color2, width), (center[0] - radius, center[1] - radius))
+
+def modal_surface():
+    """The instructions modal background: a dark purple gradient with a white border."""
+    key = ('modal',)
+    if key not in _gradients:
+        surface = gradient_surface((500, 400), DARK_PURPLE_TOP, DARK_PURPLE_BOTTOM, alpha=230).copy()
+        pygame.draw.rect(surface, WHITE, surface.get_rect(), 2, border_radius=10)
+        _gradients[key] = surface
+    return _gradients[key]
+
+def modal_overlay():
+    key = ('overlay',)
+    if key not in _gradients:
+        overlay = pygame.Surface((800, 600), pygame.SRCALPHA)
+        overlay.fill(MODAL_COLOR)
+        _gradients[key] = overlay
+    return _gradients[key]
+
+preview = None  # webcam.CameraPreview, created the first time the camera is shown
 
 # Buttons
 # Place menu in the top right corner
@@ -179,11 +244,42 @@ buttons = [
     Button('Quit Game', button_x, button_y_start + 2 * (button_height + button_gap), button_width, button_height, quit_game)
 ]
 
-# Main loop
-running = True
-while running:
-    screen.blit(background, (0, 0))
-
+def init():
+    """Open the window and load the background, gradients and fonts (once)."""
+    global screen, background, font, small_font, button_font
+    if screen is not None:
+        return
+    # Looking up Arial scans the system fonts; do it while the window opens
+    font_path = []
+    lookup = threading.Thread(target=lambda: font_path.append(pygame.font.match_font('Arial')),
+                              name="font-lookup", daemon=True)
+    lookup.start()
+
+    # Only what the menu uses; pygame.init() would also start audio and joysticks
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((800, 600))
+    pygame.display.set_caption("Retro Runway - Main Menu")
+    trace.mark("init")
+
+    # Load your uploaded background
+    background = pygame.image.load(BACKGROUND_PATH)
+    background = pygame.transform.scale(background, (800, 600))
+    # Build the menu's gradients up front, hover variants included
+    for button in buttons:
+        gradient_surface(button.rect.size, PURPLE, BLUE)
+        gradient_surface(button.rect.size, HOVER_PURPLE, HOVER_BLUE)
+    trace.mark("assets")
+
+    lookup.join()
+    font = pygame.font.Font(font_path[0], 32)
+    small_font = pygame.font.Font(font_path[0], 24)
+    button_font = pygame.font.Font(font_path[0], 20)
+    trace.mark("fonts")
+
+def handle_events():
+    """Dispatch this frame's events; returns False once the window is closed."""
+    running = True
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             # Try to delete the file before quitting
@@ -204,6 +300,12 @@ while running:
                 button.check_click(event)
         if show_instructions and close_button:
             close_button.check_click(event)
+    return running
+
+def draw_frame():
+    """Render one menu frame to the screen (without flipping)."""
+    global preview
+    screen.blit(background, (0, 0))
 
     # Draw buttons
     for button in buttons:
@@ -212,21 +314,11 @@ while running:
     # Modal for instructions
     if show_instructions:
         # Semi-transparent overlay
-        overlay = pygame.Surface((800, 600), pygame.SRCALPHA)
-        overlay.fill(MODAL_COLOR)
-        screen.blit(overlay, (0, 0))
+        screen.blit(modal_overlay(), (0, 0))
 
         modal_rect = pygame.Rect(150, 100, 500, 400)
-        # Draw dark purple gradient modal background
-        modal_surface = pygame.Surface((500, 400), pygame.SRCALPHA)
-        for i in range(400):
-            ratio = i / 400
-            r = int(DARK_PURPLE_TOP[0] * (1 - ratio) + DARK_PURPLE_BOTTOM[0] * ratio)
-            g = int(DARK_PURPLE_TOP[1] * (1 - ratio) + DARK_PURPLE_BOTTOM[1] * ratio)
-            b = int(DARK_PURPLE_TOP[2] * (1 - ratio) + DARK_PURPLE_BOTTOM[2] * ratio)
-            pygame.draw.line(modal_surface, (r, g, b, 230), (0, i), (500, i))
-        pygame.draw.rect(modal_surface, WHITE, modal_surface.get_rect(), 2, border_radius=10)
-        screen.blit(modal_surface, (150, 100))
+        # Dark purple gradient modal background
+        screen.blit(modal_surface(), modal_rect)
 
         instructions = [
             "Instructions:",
@@ -239,7 +331,7 @@ while running:
         ]
 
         for idx, line in enumerate(instructions):
-            text = small_font.render(line, True, WHITE)
+            text = text_cache.render(small_font, line, True, WHITE)
             screen.blit(text, (modal_rect.x + 20, modal_rect.y + 20 + idx * 40))
 
         # Position the close button at the bottom of the modal
@@ -249,39 +341,19 @@ while running:
             close_button.draw(screen)
 
     # Camera view
-    if show_camera and cap.isOpened():
-        ret, frame = cap.read()
-        if ret:
-            # Convert OpenCV frame to Pygame surface
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            frame = np.rot90(frame)
-            frame = pygame.surfarray.make_surface(frame)
-            frame = pygame.transform.scale(frame, (400, 300))
-
-            # Create a transparent surface for the circular camera feed
-            cam_surface = pygame.Surface((400, 300), pygame.SRCALPHA)
-            cam_surface.fill((0, 0, 0, 0))  # Fully transparent
-
-            # Create a circular mask
-            mask = pygame.Surface((400, 300), pygame.SRCALPHA)
-            mask.fill((0, 0, 0, 0))
-            pygame.draw.circle(mask, (255, 255, 255, 255), (200, 150), 150)
+    if show_camera and camera.is_opened():
+        latest = camera.latest()
+        if latest is not None:
+            _, frame = latest
+            if preview is None:
+                from webcam import CameraPreview
+                preview = CameraPreview()
 
             # Decide what to show: captured image or live feed
             if not show_live_feed and captured_image is not None:
-                # Show the captured image
-                preview = cv2.cvtColor(captured_image, cv2.COLOR_BGR2RGB)
-                preview = np.rot90(preview)
-                preview = pygame.surfarray.make_surface(preview)
-                preview = pygame.transform.scale(preview, (400, 300))
-                preview.set_colorkey((0, 0, 0))
-                cam_surface.blit(preview, (0, 0))
-                cam_surface.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                cam_surface = preview.captured(captured_image)
             else:
-                # Show the live feed
-                frame.set_colorkey((0, 0, 0))
-                cam_surface.blit(frame, (0, 0))
-                cam_surface.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                cam_surface = preview.live(frame)
 
             # Draw gradient border (no black rectangle)
             circle_center = (400, 300)
@@ -301,10 +373,6 @@ while running:
                 button.draw(screen, color_override=BLACK)
                 x += button.rect.width + 40
 
-    pygame.display.flip()
-
-pygame.quit()
-
 def cleanup_captured_image():
     try:
         # Wait a moment to ensure file is released
@@ -318,4 +386,41 @@ def cleanup_captured_image():
     except Exception as e:
         print(f"Error deleting captured_image.png in atexit: {e}")
 
-atexit.register(cleanup_captured_image)
+def screen_state():
+    """Everything except the live camera feed that changes what the menu shows."""
+    mouse_pos = pygame.mouse.get_pos()
+    visible = list(buttons)
+    if show_camera:
+        visible += camera_buttons
+    if show_instructions and close_button:
+        visible.append(close_button)
+    return (
+        show_instructions, show_camera, show_live_feed, image_captured,
+        tuple((b.text, b.rect.collidepoint(mouse_pos)) for b in visible)
+    )
+
+# Main loop
+def main():
+    init()
+    running = True
+    shown_state = None
+    while running:
+        running = handle_events()
+        state = screen_state()
+        if not DIRTY_RECTS or state != shown_state:
+            draw_frame()
+            pygame.display.flip()
+        elif show_camera:
+            # Only the camera preview changes from frame to frame
+            draw_frame()
+            pygame.display.update(CAMERA_REGION)
+        shown_state = state
+        trace.frame_shown()
+
+    if camera:
+        camera.stop()
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
+    atexit.register(cleanup_captured_image)